@@ -7,6 +7,7 @@ Purpose: This script contains the function that computes the hot water consumpti
 
 import numpy as np
 import datetime as dt
+from progress import message
 
 
 def limit_power(power_per_time, max_power):
@@ -45,7 +46,7 @@ def limit_power(power_per_time, max_power):
                 over_power = over_power + actual_power - max_power
                 power_per_time[i] = max_power
     if over_power > 0:
-        print(f'{over_power/60e3} kWh of hot water energy should be added next day')
+        message(f'{over_power/60e3} kWh of hot water energy should be added next day')
     return power_per_time
 
 def hot_water_elec_consumption(mDHW, year, max_power=3):
@@ -10,18 +10,17 @@ August 2024
 # Import require modules
 import os
 import sys
-import random
 strobeDir = os.path.dirname(os.path.realpath(__file__)) # get path where this file is (StROBe path)
 sys.path.append(os.path.join(strobeDir, 'StROBe/Corpus'))
 
-os.chdir(os.path.join(strobeDir, 'StROBe/Corpus'))
 import numpy as np
-from StROBe.Corpus.residential import Household, Equipment
-import StROBe.Corpus.stats as stats
-import StROBe.Corpus.data as data
+from StROBe.Corpus.residential import Household, Equipment, ownership
+import data # by the name residential and stats import it with: one module, and one cache, per process
 from StROBe.Data.Appliances import set_appliances
 from StROBe.Data.Households import households
 from constant import special_appliances
+from instrumentation import stage
+import sampling
 import itertools
 import pandas as pd
 
@@ -38,6 +37,7 @@ class Household_mod(Household):
             Define the employment type of all household members based on time
             use survey statistics or the given kwargs.
             '''
+            rng = self.rng('members')
             members = []
             # First we check if membertypes are given as **kwargs
             if 'members' in kwargs:
@@ -49,18 +49,18 @@ class Household_mod(Household):
                             def contain_all_values(liste, valeurs):
                                 return all(valeur in liste for valeur in valeurs)
                             list_dwel = [value for value in households.values() if contain_all_values(value, other_members) and len(value) == len(members)]
-                            members = random.choice(list_dwel)
+                            members = rng.choice(list_dwel)
                         else : 
                             list_dwel = [valeur for valeur in households.values() if len(valeur) == len(members)]
-                            members = random.choice(list_dwel)
+                            members = rng.choice(list_dwel)
                 else:
                     raise TypeError('Given membertypes is no List of strings.')
             elif 'nb_people' in kwargs :
                 list_dwel = [valeur for valeur in households.values() if len(valeur) == kwargs['nb_people']]
-                members = random.choice(list_dwel)
+                members = rng.choice(list_dwel)
             # If no types are given, random statististics are applied
             else:
-                key = random.randint(1, len(households))
+                key = rng.randint(1, len(households))
                 members = households[key]
             # And return the members as list fo strings
             return members
@@ -72,41 +72,33 @@ class Household_mod(Household):
             '''
             # Loop through all appliances and pick randomly based on the
             # rate of ownership.
-            # changes for new cold-appliance fix #######################################
-            
-            # Based on 10000 runs, these new values combined with rule-based fix below
-            # lead to the same overall ownership as the original values.
-            # We change it here so that the original remain in the Appliances file.
-            set_appliances['Refrigerator']['owner']=0.27     # original:  0.430
-            set_appliances['FridgeFreezer']['owner']=0.40    # original:  0.651
-            set_appliances['ChestFreezer']['owner']=0.19     # original:  0.163
-            set_appliances['UprightFreezer']['owner']=0.31   # original:  0.291
-            
+            # The ownership of the cold appliances is changed for the cold-appliance fix
+            # below (see residential.COLD_APPLIANCES), without changing the shared Appliances table.
+            rng = self.rng('appliances')
             app_n = []
             for app in set_appliances:
                 if set_appliances[app]['type'] == 'appliance':
-                    obj = Equipment(**set_appliances[app])
                     if 'selected_appliances' in kwargs:
                         if set_appliances[app]['name'] in kwargs['selected_appliances'] :
-                            owner = float(kwargs['selected_appliances'][app]) >= random.random()
+                            owner = float(kwargs['selected_appliances'][app]) >= rng.random()
                         elif set_appliances[app]['name'] not in special_appliances : 
-                            owner = obj.owner >= random.random()
+                            owner = ownership(app) >= rng.random()
                     else :
-                        owner = obj.owner >= random.random()   
+                        owner = ownership(app) >= rng.random()   
                     app_n.append(app) if owner else None
                     
             # Cold appliances fix:   ###############################################        
             if not ('FridgeFreezer' in app_n) and not ('Refrigerator' in app_n): # if there was none of the two-> add one of the two.
                 #  Find probability of household to own FF instead of R: (FF ownership over sum of two ownerships-> scale to 0-1 interval)
-                prob=set_appliances['FridgeFreezer']['owner']/(set_appliances['FridgeFreezer']['owner']+set_appliances['Refrigerator']['owner'])
+                prob=ownership('FridgeFreezer')/(ownership('FridgeFreezer')+ownership('Refrigerator'))
                 # if random number is below prob, then the household will own a FF, otherwise a R -> add it
-                app_n.append('FridgeFreezer') if prob >= random.random()  else app_n.append('Refrigerator') 
+                app_n.append('FridgeFreezer') if prob >= rng.random()  else app_n.append('Refrigerator') 
             
             if 'FridgeFreezer' in app_n and 'ChestFreezer' in app_n and 'UprightFreezer' in app_n:  #if there were 3 freezers-> remove a freezer-only
                 #find probability of household to own CF instead of UF:  (CF ownership over sum of two ownerships-> scale to 0-1 interval)
-                prob=set_appliances['ChestFreezer']['owner']/(set_appliances['ChestFreezer']['owner']+set_appliances['UprightFreezer']['owner'])
+                prob=ownership('ChestFreezer')/(ownership('ChestFreezer')+ownership('UprightFreezer'))
                 # if random number is below prob, then the household will own a CF, otherwise an UF-> remove the other
-                app_n.remove('UprightFreezer') if prob >= random.random()  else app_n.remove('ChestFreezer') #remove the one you don't own
+                app_n.remove('UprightFreezer') if prob >= rng.random()  else app_n.remove('ChestFreezer') #remove the one you don't own
                 
             #########################################################################
             return app_n
@@ -124,10 +116,11 @@ class Household_mod(Household):
             members occupation in time use survey data.
             '''
             clustersList = []
+            rng = self.rng('clusters')
             # loop for every individual in the household
             for ind in members:
                 if ind != 'U12':
-                    clu_i = data.get_clusters(ind)
+                    clu_i = data.get_clusters(ind, rng=rng)
                     clustersList.append(clu_i)
             # and return the list of clusters
             return clustersList
@@ -175,11 +168,11 @@ class Household_mod(Household):
     
         #######################################################################
         # select a type based on random number and probabilities associated to types
-        rnd = np.random.random()
-        shtype = str(1 + stats.get_probability(rnd, types['prob'], 'prob'))
+        rng = self.rng('shsetting')
+        shtype = str(sampling.choice(range(2, 8), types['prob'], rng))
         #define which rooms will be heated
         if len(shr[shtype]) != 1: # if there are more possibilities, choose one randomly
-            nr = np.random.randint(len(shr[shtype]))
+            nr = rng.randrange(len(shr[shtype]))
             shrooms = shr[shtype][nr]
         else:
             shrooms = shr[shtype][0]
@@ -234,7 +227,7 @@ class Household_mod(Household):
                 # create the equipment object with data from Appliances.py
                 eq = Equipment(**set_appliances[app])
                 # simulate what the load will be
-                r_app, n_app = eq.simulate(nday, dow, self.clustersList, self.occ)
+                r_app, n_app = eq.simulate(nday, dow, self.clustersList, self.occ, rng=self.rng(f'appliance.{app}'), offset=self.offset)
                 # and add to total load
                 result_n.update({app:n_app})
                 power += r_app['P']
@@ -246,7 +239,7 @@ class Household_mod(Household):
             self.app_consumption = app_consumption
             # a new time axis for power output is to be created 
             # since a different time step is used in comparison to occupancy
-            time = 4*60*60 + np.arange(0, (nmin+1)*60, 60) # in seconds, starts at 4:00 AM
+            time = 4*60*60 + self.offset*600 + np.arange(0, (nmin+1)*60, 60) # in seconds, starts at 4:00 AM (or midnight, see __chronology__)
 
             result = {'time':time, 'P':power, 'Q':react, 'QRad':radi, 'QCon':conv }
         
@@ -277,13 +270,14 @@ class Household_mod(Household):
             # and one at the end in case of a leap year.
             # Furthermore, the data starts at midnight, so a shift to 4am is necessary
             # so that it coincides with the occupancy data!!! (the first 4 h are moved to the end) 
-            os.chdir(r'../Data')
-            irr = np.loadtxt('Climate/irradiance.txt')
+            irr = data.get_irradiance()
             irr=np.insert(irr,1,irr[-24*60:]) # add december 31 to start of year (for extra day used to fill first 4h)
             irr=np.append(irr,irr[-24*60:]) # add december 31 to end of year in case of leap year
             irr = np.roll(irr,-240) # brings first 4h to end, to match start of occupancy at 4 AM instead of midnight
+            irr = irr[self.offset*10:] # loads starting at midnight of the initiation day (see __chronology__)
             # script ##########################################################
             # a yearly simulation is basic, also in a unittest
+            rng = self.rng('lighting')
             nday = self.nday
             nbin = 144 # steps in occupancy data per day (10min steps)
             nmin = nday * 24 * 60 # number of minutes in total number of days
@@ -309,7 +303,7 @@ class Household_mod(Household):
                     # determine final power usage after stepwise adjustments
                     if occ_m[to] > int(1): # if OFF, it stays that way
                         P[tl] = pow_id[tl]
-                    elif random.random() <= prob_adj: # if ON, check if adjustment happens (random number< prob_adj)
+                    elif rng.random() <= prob_adj: # if ON, check if adjustment happens (random number< prob_adj)
                         delta = P[tl-1] - pow_id[tl] # difference between previous step and "ideal" current step 
                         if delta > 0 and pow_adj/2 < np.abs(delta) : # if absolute difference is larger than half of the adjustment step
                             P[tl] = P[tl-1]-pow_adj  # the new power is the previous one, decreased by the adjustment step
@@ -332,8 +326,10 @@ class Household_mod(Household):
             
             return None
 
-        receptacles(self)
-        lightingload(self)
+        with stage('receptacles'):
+            receptacles(self)
+        with stage('lighting'):
+            lightingload(self)
  
         self.variables.update({'P': 'Active power demand for appliances and lighting in W.',
                                'Q':'Reactive power demand for appliances and lighting in W.',
@@ -363,8 +359,11 @@ class Household_mod(Household):
         # delete first 20h and last 4 h  so that data starts and ends at midnight
         # keep an extra time step for IDEAS simulations 
         # (we assume first value indicates average occupancy, P, etc from time 0 to time 0+time step)
-        self.nday=self.nday-1 # change back to originally asked number (remove extra initiation day)
-        start=20*60 # start minute, after 20h -> midnight of initiation day
+        if self.offset == 0:
+            self.nday=self.nday-1 # change back to originally asked number (remove extra initiation day)
+            start=20*60 # start minute, after 20h -> midnight of initiation day
+        else:
+            start=0 # the loads already start at midnight of the initiation day (see __chronology__)
         stop=start + self.nday*24*60 # end minute, 4h before end of last day -> midnight 
         
         self.occ_m = self.occ_m[0][start//10:stop//10+1] # 10-min resolution, so for indeces: devide start & stop by 10.
@@ -6,19 +6,20 @@ Created on Thu Feb 06 09:48:07 2014
 """
 
 import os
+import random
+import functools
+import types
 import numpy as np
-import stats
+import data_bundle # the data files, compiled once and read once per process
+import sampling
 
-def get_clusters(employment, **kwargs):
+def get_clusters(employment, rng=random, **kwargs):
     '''
     Find the clusters for weekdays, saturday and sunday for a household member
     of the given eployment type based on the Crosstables given at
     # http://homepages.vub.ac.be/~daerts/Occupancy.html
+    The clusters are drawn from the random generator 'rng'.
     '''
-    #first go the the correct location
-    cdir = os.getcwd()
-    PATH = '../Data/Aerts_Occupancy/Crosstables/'
-    os.chdir(PATH)
     #create an empty dictionary
     keys = ['wkdy', 'sat', 'son']
     cluDict = dict()
@@ -26,34 +27,49 @@ def get_clusters(employment, **kwargs):
     # we find the cluster for each of the daytypes for the given employment
     # in 'Crosstable_employment.txt'
     for key in keys:
-        order = ['U12','FTE','PTE','Unemployed','Retired','School']
-        emp_i = order.index(employment)
-        data = np.loadtxt('Crosstable_Employment_'+key+'.txt', float).T[emp_i]
-        rnd = np.random.random()
-        cluster = stats.get_probability(rnd, data, p_type='prob')
+        cluster = cluster_table(key, employment).draw(rng)
         cluDict.update({key:cluster})
     ##########################################################################
     # and return the final cluster id's
-    os.chdir(cdir)
     return cluDict
 
+@functools.lru_cache(maxsize=None)
+def cluster_table(key, employment):
+    '''
+    Distribution of the clusters of the daytype 'key' for the given employment
+    (sampling.AliasTable), created once per process.
+    '''
+    order = ['U12','FTE','PTE','Unemployed','Retired','School']
+    emp_i = order.index(employment)
+    data = data_bundle.get('crosstable.'+key).T[emp_i]
+    return sampling.AliasTable(range(1, len(data)+1), data)
+
+def freeze(dictionary):
+    '''
+    Read-only view of a dictionary and of the dictionaries it contains.
+    '''
+    return types.MappingProxyType({key: freeze(value) if isinstance(value, dict) else value
+                                   for key, value in dictionary.items()})
+
 def get_occDict(cluster, **kwargs):
     '''
     Create the dictionary with occupancy data based on the files retrieved from
     Aerts et al. as given at http://homepages.vub.ac.be/~daerts/Occupancy.html
     and stored in 'StROBe/Data/Aerts_Occupancy'.
+    It is created once per cluster and per process, and shared read-only by all
+    the households, members and days.
     '''
-    #first go the the correct location
-    cdir = os.getcwd()
-    DATA_PATH = '../Data/Aerts_Occupancy'
-    PATH = DATA_PATH + '/Pattern' + str(cluster)
-    os.chdir(PATH)
+    return load_occDict(str(cluster))
+
+@functools.lru_cache(maxsize=None)
+def load_occDict(cluster):
+    PATH = 'occupancy.' + cluster + '.'
     # create an empty dictionary
     occDict = dict()
     ##########################################################################
     # first we load the occupancy start states 'ss' from StartStates.txt
     ss = dict()
-    data = np.loadtxt('StartStates.txt', float)
+    data = data_bundle.get(PATH + 'StartStates')
     for i in range(len(data)):
         ss.update({str(i+1):data[i]})
     # and add the 'ss' data to the occupancy dictionary
@@ -61,7 +77,7 @@ def get_occDict(cluster, **kwargs):
     ##########################################################################
     # Second we load the occupancy transitions state probabilities 'os'
     # from TransitionProbability.txt
-    data = np.loadtxt('TransitionProbability.txt', float)
+    data = data_bundle.get(PATH + 'TransitionProbability')
     for i in range(3):
         os_i = dict()
         for j in range(48):
@@ -70,7 +86,7 @@ def get_occDict(cluster, **kwargs):
         occDict.update({'os_'+str(i+1):os_i})
     ##########################################################################
     # Third we load the Markov time density 'ol' from DurationProbability.txt
-    data = np.loadtxt('DurationProbability.txt', float)
+    data = data_bundle.get(PATH + 'DurationProbability')
     for i in range(3):
         ol_i = dict()
         for j in range(48):
@@ -79,19 +95,20 @@ def get_occDict(cluster, **kwargs):
         occDict.update({'ol_'+str(i+1):ol_i})
     ##########################################################################
     # and return the final occDict
-    os.chdir(cdir)
-    return occDict
+    return freeze(occDict)
 
 def get_actDict(cluster, **kwargs):
     '''
     Create the dictionary with activity data based on the files retrieved from
     Aerts et al. as given at http://homepages.vub.ac.be/~daerts/Activity.html
     and stored in 'StROBe/Data/Aerts_activity'.
+    It is created once per cluster and per process, and shared read-only by all
+    the households, appliances and days.
     '''
-    #first go the the correct location
-    cdir = os.getcwd()
-    DATA_PATH = '../Data/Aerts_Activities'
-    os.chdir(DATA_PATH)
+    return load_actDict(str(cluster))
+
+@functools.lru_cache(maxsize=None)
+def load_actDict(cluster):
     # create an empty dictionary
     actDict = dict()
     ##########################################################################
@@ -101,12 +118,17 @@ def get_actDict(cluster, **kwargs):
     ##########################################################################
     # Second we load the activity proclivity functions
     # from Patter*cluster*.txt
-    FILNAM = 'Pattern'+str(cluster)+'.txt'
-    data = np.loadtxt(FILNAM, float)
+    data = data_bundle.get('activity.'+cluster)
     for i in range(10):
         actDict.update({act[i]:data.T[i]})
     ##########################################################################
     # and return the final actDict
     actDict.update({'period':600, 'steps':144})
-    os.chdir(cdir)
-    return actDict
+    return freeze(actDict)
+
+def get_irradiance(**kwargs):
+    '''
+    Global horizontal irradiance at a 1-minute time step for Uccle, Belgium, over
+    a year starting at midnight, as stored in 'StROBe/Data/Climate'.
+    '''
+    return data_bundle.get('irradiance')
@@ -18,11 +18,39 @@ import itertools
 import stats
 import data
 
-sys.path.append("..")
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..')) # StROBe, for Data
 from Data.Households import households
 from Data.Appliances import set_appliances
 
 from appliances_programs import TumbleDryer, WashingMachine, DishWasher
+from instrumentation import stage
+import occupancy_pool
+import sampling
+
+# Ownership rates of the cold appliances used instead of those of Appliances.py: based on 10000 runs,
+# these values combined with the rule-based fix of Household.parameterize() lead to the same overall
+# ownership as the original values, which remain in the Appliances file.
+COLD_APPLIANCES = {'Refrigerator': 0.27,   # original:  0.430
+                   'FridgeFreezer': 0.40,  # original:  0.651
+                   'ChestFreezer': 0.19,   # original:  0.163
+                   'UprightFreezer': 0.31} # original:  0.291
+
+def ownership(app):
+    '''
+    Ownership rate of an appliance, with the cold-appliance fix (see COLD_APPLIANCES).
+    '''
+    return COLD_APPLIANCES.get(app, set_appliances[app]['owner'])
+
+# occupancy data from survey are given per 30 min, so we need to know in which of 48 bins to look
+# for data at each 10-min step of a day (starting at 4am)
+T48 = sorted(list(range(1, 49)) * 3)
+
+def steps(nday, offset=0, nbin=144):
+    '''
+    Day (index in the days of the week) and 10-min step of the day (from 4am) of each 10-min step
+    of a period of 'nday' days, starting at the step 'offset' of its first day.
+    '''
+    return ((t//nbin, t%nbin) for t in range(offset, offset + nday*nbin))
 
 class Household(object):
     '''
@@ -50,9 +78,25 @@ class Household(object):
         # first define the name of the household object
         self.creation = time.asctime()
         self.name = name
+        # random streams of the household components (see seeding.py), if given
+        self.streams = kwargs.pop('streams', None)
+        # size of the pool of typical weeks to draw the occupancy from (see occupancy_pool.py), None to simulate it
+        self.occupancy_pool = kwargs.pop('occupancy_pool', None)
+        # simulate the extra initiation day before the first day (see __chronology__)
+        self.initiation_day = kwargs.pop('initiation_day', True)
         self.parameterize(**kwargs)
         self.variables=dict() # dictionary with explanation of main outputs, filled in in submodules
 
+    def rng(self, component):
+        '''
+        Random generator used by the given component of the household: its own
+        stream if the household was created with streams, the global random
+        module otherwise.
+        '''
+        if self.streams is None:
+            return random
+        return self.streams(component)
+
     def parameterize(self, **kwargs):
         '''
         Get a household definition for occupants and present appliances based
@@ -73,7 +117,7 @@ class Household(object):
                     raise TypeError('Given membertypes is no List of strings.')
             # If no types are given, random statististics are applied
             else:
-                key = random.randint(1, len(households))
+                key = self.rng('members').randint(1, len(households))
                 members = households[key]
             # And return the members as list fo strings
             return members
@@ -85,35 +129,27 @@ class Household(object):
             '''
             # Loop through all appliances and pick randomly based on the
             # rate of ownership.
-            #changes for new cold-appliance fix #######################################
-            
-            # Based on 10000 runs, these new values combined with rule-based fix below
-            # lead to the same overall ownership as the original values.
-            # We change it here so that the original remain in the Appliances file.
-            set_appliances['Refrigerator']['owner']=0.27     # original:  0.430
-            set_appliances['FridgeFreezer']['owner']=0.40    # original:  0.651
-            set_appliances['ChestFreezer']['owner']=0.19     # original:  0.163
-            set_appliances['UprightFreezer']['owner']=0.31   # original:  0.291
-            
+            # The ownership of the cold appliances is changed for the cold-appliance fix
+            # below (see COLD_APPLIANCES), without changing the shared Appliances table.
+            rng = self.rng('appliances')
             app_n = []
             for app in set_appliances:
                 if set_appliances[app]['type'] == 'appliance':
-                    obj = Equipment(**set_appliances[app])
-                    owner = obj.owner >= random.random()
+                    owner = ownership(app) >= rng.random()
                     app_n.append(app) if owner else None
                     
             # Cold appliances fix:   ###############################################        
             if not ('FridgeFreezer' in app_n) and not ('Refrigerator' in app_n): # if there was none of the two-> add one of the two.
                 #  Find probability of household to own FF instead of R: (FF ownership over sum of two ownerships-> scale to 0-1 interval)
-                prob=set_appliances['FridgeFreezer']['owner']/(set_appliances['FridgeFreezer']['owner']+set_appliances['Refrigerator']['owner'])
+                prob=ownership('FridgeFreezer')/(ownership('FridgeFreezer')+ownership('Refrigerator'))
                 # if random number is below prob, then the household will own a FF, otherwise a R -> add it
-                app_n.append('FridgeFreezer') if prob >= random.random()  else app_n.append('Refrigerator') 
+                app_n.append('FridgeFreezer') if prob >= rng.random()  else app_n.append('Refrigerator') 
             
             if 'FridgeFreezer' in app_n and 'ChestFreezer' in app_n and 'UprightFreezer' in app_n:  #if there were 3 freezers-> remove a freezer-only
                 #find probability of household to own CF instead of UF:  (CF ownership over sum of two ownerships-> scale to 0-1 interval)
-                prob=set_appliances['ChestFreezer']['owner']/(set_appliances['ChestFreezer']['owner']+set_appliances['UprightFreezer']['owner'])
+                prob=ownership('ChestFreezer')/(ownership('ChestFreezer')+ownership('UprightFreezer'))
                 # if random number is below prob, then the household will own a CF, otherwise an UF-> remove the other
-                app_n.remove('UprightFreezer') if prob >= random.random()  else app_n.remove('ChestFreezer') #remove the one you don't own
+                app_n.remove('UprightFreezer') if prob >= rng.random()  else app_n.remove('ChestFreezer') #remove the one you don't own
                 
             #########################################################################
             return app_n
@@ -131,10 +167,11 @@ class Household(object):
             members occupation in time use survey data.
             '''
             clustersList = []
+            rng = self.rng('clusters')
             # loop for every individual in the household
             for ind in members:
                 if ind != 'U12':
-                    clu_i = data.get_clusters(ind)
+                    clu_i = data.get_clusters(ind, rng=rng)
                     clustersList.append(clu_i)
             # and return the list of clusters
             return clustersList
@@ -161,11 +198,16 @@ class Household(object):
 
         self.year = year
         self.__chronology__(year, ndays)
-        self.__occupancy__()
-        self.__plugload__()
-        self.__dhwload__()
-        self.__shsetting__()
-        self.roundUp()
+        with stage('occupancy'):
+            self.__occupancy__()
+        with stage('plugload'):
+            self.__plugload__()
+        with stage('dhwload'):
+            self.__dhwload__()
+        with stage('shsetting'):
+            self.__shsetting__()
+        with stage('roundUp'):
+            self.roundUp()
 
     def __chronology__(self, year, ndays=None):
         '''
@@ -188,6 +230,14 @@ class Household(object):
         # and return the day_of_week for the entire year
         self.dow = day_of_week
         self.nday = nday
+        # 10-min step of the initiation day (from 4am) at which the simulation of the loads starts.
+        # Without the initiation day, the occupancy still runs from 4am to midnight of the
+        # initiation day to reach its state at midnight, but the loads only start at midnight
+        # and only the requested days are simulated.
+        self.offset = 0
+        if not getattr(self, 'initiation_day', True):
+            self.offset = 20*6
+            self.nday = nday - 1
         return None
 
     def __occupancy__(self, min_form = True, min_time = False):
@@ -196,6 +246,7 @@ class Household(object):
         - A weekday, saturday and sunday are simulated, after which a typical week is created and repeated for the entire simulation period.
         - The starting day of the year is taken into account. 
         - The occupancy profiles start at 4:00 AM, in accordance with the used survey data. (later shifted, see roundUp())
+        - If the household has an occupancy pool, the typical week of each member is drawn from the pool of its clusters instead.
         '''
         def check(occday, min_form = True, min_time = False): # -->> this check is not effective !!!
             '''
@@ -235,10 +286,10 @@ class Household(object):
             # both have to be true to allow continuation, and we return boolean
             return shape and length # --->>> Check not effective, always True  !!!!!!!!!!!
 
-        def dayrun(start, cluster):
+        def dayrun(start, cluster, rng):
             '''
             Simulation of a single day according to start state 'start'
-            and the stochastics associated with 'cluster'.
+            and the stochastics associated with 'cluster', drawing from 'rng'.
             '''
 
             # script ##########################################################
@@ -247,18 +298,17 @@ class Household(object):
             # not correspond to the agreed-on rules in check().
             # ----->>> The check is currently not effectively implemented.
             daycheck = False
-            end = datetime.datetime.utcnow() + datetime.timedelta(seconds = 10)
+            end = None # deadline of the loop, set on the first day rejected by check()
             # define the corresponding MCSA object from stats.py depicting a
             # Monte Carlo Survival Analysis object.
-            SA = stats.MCSA(cluster)
+            SA = stats.MCSA(cluster, rng=rng)
             # and then keep simulating a day until True
             while daycheck == False:
                 # set start state conditions
                 tbin = 0
                 occs = np.zeros(144, dtype=int)
                 occs[0] = start
-                # occupancy data from survey are given per 30 min, so we need to know in which of 48 bins to look for data:
-                t48 = np.array(sorted(list(range(1, 49)) * 3))
+                t48 = T48
                 dt = SA.duration(start, t48[0]) # get duration of current state at start time (4am)
                 # and loop sequentially transition and duration functions
                 while tbin < 143:
@@ -274,8 +324,11 @@ class Household(object):
                 daycheck = check(occs) # ----->>> The check is currently not effectively implemented, always TRUE! 
                 # and we include a break if the while-loop takes to long until
                 # check()-conditions are fulfilled.
-                if datetime.datetime.utcnow() > end:
-                    break
+                if daycheck == False:
+                    if end is None:
+                        end = datetime.datetime.utcnow() + datetime.timedelta(seconds = 10)
+                    elif datetime.datetime.utcnow() > end:
+                        break
 
             # ouput ###########################################################
             # return occupants array if daycheck is ok
@@ -287,33 +340,30 @@ class Household(object):
             profile denoting the most active state of all members.
             '''
             # scirpt ##########################################################
-            # We start defining an array of correct length filled with the
-            # least active state and loop to see if more-active people are
-            # present at the depicted moment.
-            occs = int(3)*np.ones(len(occ[0]))
-            for member in occ:
-                for to in range(len(member)):
-                    if member[to] < occs[to]:
-                        occs[to] = member[to]
+            # The most active state is the lowest one, hence the minimum over
+            # the members at each moment (never above the least active state).
+            occs = np.minimum(np.minimum.reduce(np.asarray(occ, dtype=float)), 3)
 
             # ouput ###########################################################
             # return the merge occupancy states
             return occs
 
         # script ##############################################################
-        # We change the directory to to location where the data is stored,
-        # and create a typical week.
-        cdir = os.getcwd()
+        # We create a typical week.
         occ_week = [] #typical week
-        for member in self.clustersList:
+        for k, member in enumerate(self.clustersList):
+            rng = self.rng(f'occupancy.{k}') # each member has its own stream
+            if getattr(self, 'occupancy_pool', None) is not None:
+                occ_week.append(occupancy_pool.draw(member, self.occupancy_pool, rng).astype(float))
+                continue
             week=[] # initiate empty week
-            SA = stats.MCSA(member['wkdy'])
+            SA = stats.MCSA(member['wkdy'], rng=rng)
             startstate=SA.startstate() # random starting state of week, depending on cluster 
             for i in range(5):
-                week = np.append(week, dayrun(startstate, member['wkdy']))
+                week = np.append(week, dayrun(startstate, member['wkdy'], rng))
                 startstate=week[-1]
-            week = np.append(week, dayrun(week[-1], member['sat']))
-            week = np.append(week, dayrun(week[-1], member['son']))
+            week = np.append(week, dayrun(week[-1], member['sat'], rng))
+            week = np.append(week, dayrun(week[-1], member['son'], rng))
             occ_week.append(week)
         # A merge occupancy is created depicted the most active state of all
         # household members, later-on used for set-point temperatures and hot water tappings.
@@ -322,7 +372,7 @@ class Household(object):
         # repeating them every week and correcting for the first day of year and stop time,
         # including for the merged occupancy.
         bins = 144 # number of datapoints in one day
-        tstart = bins*(self.dow[0]) # need to sart on correct day of week
+        tstart = bins*(self.dow[0]) + self.offset # need to sart on correct day of week (and at midnight without initiation day)
         tstop = tstart + bins*(self.nday)+1 # need nday in total, plus one step (for IDEAS simulations)
         occ_year = []
         for line in range(len(occ_week)):# per separate member
@@ -332,9 +382,7 @@ class Household(object):
         occ_merged.append(np.tile(occ_merg,54)[tstart:tstop]) 
 
         # output ##############################################################
-        # chdir back to original and return the occupancy states to the class
-        # object.
-        os.chdir(cdir)
+        # return the occupancy states to the class object.
         self.occ = occ_year
         self.occ_m = occ_merged
         # and print statements
@@ -369,7 +417,7 @@ class Household(object):
                 # create the equipment object with data from Appliances.py
                 eq = Equipment(**set_appliances[app])
                 # simulate what the load will be
-                r_app, n_app = eq.simulate(nday, dow, self.clustersList, self.occ)
+                r_app, n_app = eq.simulate(nday, dow, self.clustersList, self.occ, rng=self.rng(f'appliance.{app}'), offset=self.offset)
                 # and add to total load
                 result_n.update({app:n_app})
                 power += r_app['P']
@@ -379,7 +427,7 @@ class Household(object):
                 conv += r_app['QCon']
             # a new time axis for power output is to be created 
             # since a different time step is used in comparison to occupancy
-            time = 4*60*60 + np.arange(0, (nmin+1)*60, 60) # in seconds, starts at 4:00 AM
+            time = 4*60*60 + self.offset*600 + np.arange(0, (nmin+1)*60, 60) # in seconds, starts at 4:00 AM (or midnight, see __chronology__)
 
             result = {'time':time, 'P':power, 'Q':react, 'QRad':radi, 'QCon':conv }
 
@@ -411,13 +459,14 @@ class Household(object):
             # and one at the end in case of a leap year.
             # Furthermore, the data starts at midnight, so a shift to 4am is necessary
             # so that it coincides with the occupancy data!!! (the first 4 h are moved to the end) 
-            os.chdir(r'../Data')
-            irr = np.loadtxt('Climate/irradiance.txt')
+            irr = data.get_irradiance()
             irr=np.insert(irr,1,irr[-24*60:]) # add december 31 to start of year (for extra day used to fill first 4h)
             irr=np.append(irr,irr[-24*60:]) # add december 31 to end of year in case of leap year
             irr = np.roll(irr,-240) # brings first 4h to end, to match start of occupancy at 4 AM instead of midnight
+            irr = irr[self.offset*10:] # loads starting at midnight of the initiation day (see __chronology__)
             # script ##########################################################
             # a yearly simulation is basic, also in a unittest
+            rng = self.rng('lighting')
             nday = self.nday
             nbin = 144 # steps in occupancy data per day (10min steps)
             nmin = nday * 24 * 60 # number of minutes in total number of days
@@ -443,7 +492,7 @@ class Household(object):
                     # determine final power usage after stepwise adjustments
                     if occ_m[to] > int(1): # if OFF, it stays that way
                         P[tl] = pow_id[tl]
-                    elif random.random() <= prob_adj: # if ON, check if adjustment happens (random number< prob_adj)
+                    elif rng.random() <= prob_adj: # if ON, check if adjustment happens (random number< prob_adj)
                         delta = P[tl-1] - pow_id[tl] # difference between previous step and "ideal" current step 
                         if delta > 0 and pow_adj/2 < np.abs(delta) : # if absolute difference is larger than half of the adjustment step
                             P[tl] = P[tl-1]-pow_adj  # the new power is the previous one, decreased by the adjustment step
@@ -466,8 +515,10 @@ class Household(object):
             
             return None
 
-        receptacles(self)
-        lightingload(self)
+        with stage('receptacles'):
+            receptacles(self)
+        with stage('lighting'):
+            lightingload(self)
  
         self.variables.update({'P': 'Active power demand for appliances and lighting in W.',
                                'Q':'Reactive power demand for appliances and lighting in W.',
@@ -490,9 +541,9 @@ class Household(object):
         result_n = dict()
         for tap in self.taps:
             # create the tapping object with data from Appliances.py
-            eq = Equipment(**set_appliances[tap])
+            eq = Equipment(name=tap, **set_appliances[tap]) # tappings have no name in Appliances.py
             # simulate the DHW demand
-            r_tap, n_tap = eq.simulate(nday, dow, cluster, occ_m)
+            r_tap, n_tap = eq.simulate(nday, dow, cluster, occ_m, rng=self.rng(f'tapping.{tap}'), offset=self.offset)
             result_n.update({tap:n_tap})
             flow += r_tap['mDHW']
     
@@ -537,11 +588,11 @@ class Household(object):
     
         #######################################################################
         # select a type based on random number and probabilities associated to types
-        rnd = np.random.random()
-        shtype = str(1 + stats.get_probability(rnd, types['prob'], 'prob'))
+        rng = self.rng('shsetting')
+        shtype = str(sampling.choice(range(2, 8), types['prob'], rng))
         #define which rooms will be heated
         if len(shr[shtype]) != 1: # if there are more possibilities, choose one randomly
-            nr = np.random.randint(np.shape(shr[shtype])[0])
+            nr = rng.randrange(np.shape(shr[shtype])[0])
             shrooms = shr[shtype][nr]
         else:
             shrooms = shr[shtype][0]
@@ -594,8 +645,11 @@ class Household(object):
         # delete first 20h and last 4 h  so that data starts and ends at midnight
         # keep an extra time step for IDEAS simulations 
         # (we assume first value indicates average occupancy, P, etc from time 0 to time 0+time step)
-        self.nday=self.nday-1 # change back to originally asked number (remove extra initiation day)
-        start=20*60 # start minute, after 20h -> midnight of initiation day
+        if self.offset == 0:
+            self.nday=self.nday-1 # change back to originally asked number (remove extra initiation day)
+            start=20*60 # start minute, after 20h -> midnight of initiation day
+        else:
+            start=0 # the loads already start at midnight of the initiation day (see __chronology__)
         stop=start + self.nday*24*60 # end minute, 4h before end of last day -> midnight 
         
         self.occ_m = self.occ_m[0][start//10:stop//10+1] # 10-min resolution, so for indeces: devide start & stop by 10.
@@ -639,7 +693,21 @@ class Equipment(object):
         for (key, value) in kwargs.items():
             setattr(self, key, value)
 
-    def simulate(self, nday, dow, clustersList, occ):
+    def simulate(self, nday, dow, clustersList, occ, rng=random, offset=0):
+        '''
+        Simulate the equipment, drawing from the random generator 'rng'.
+        The simulation starts at the 10-min step 'offset' of the first day of 'dow' (see steps()),
+        from which 'occ' is given.
+        Its time is recorded as the stage '<type>.<name>' (eg. 'appliance.DishWasher')
+        when the instrumentation is enabled.
+        '''
+        with stage(f'{self.type}.{self.name}'):
+            return self.__simulate__(nday, dow, clustersList, occ, rng, offset)
+
+    def __simulate__(self, nday, dow, clustersList, occ, rng, offset=0):
+        '''
+        Simulation of the equipment, see simulate().
+        '''
 
         def stochastic_flow(self, nday, dow, clusterList, occ):
             '''
@@ -668,7 +736,7 @@ class Equipment(object):
             left = -1 # time counter for tapping duration
             n_fl = 0
             flow = np.zeros(nmin+1)
-            for doy, step in itertools.product(range(nday), range(nbin)):
+            for doy, step in steps(nday, offset, nbin):
                 dow_i = dow[doy]
                 to += 1
                 for run in range(0, 10):
@@ -684,9 +752,9 @@ class Equipment(object):
                             occs = 1 if occ[to] == 1 else 0
                             prob = occs * actdata.get_var(dow_i, act, step)
                         # check if there is a statechange in the tap
-                        if random.random() < prob * self.cal:
+                        if rng.random() < prob * self.cal:
                             n_fl += 1
-                            left = random.gauss(len_cycle, len_cycle/10)
+                            left = rng.gauss(len_cycle, len_cycle/10)
                         flow[tl] += self.standby_flow
                     else:
                         left += -1
@@ -711,11 +779,11 @@ class Equipment(object):
             if prog:
                 #print(self.name)
                 if self.name == 'TumbleDryer':
-                    program = TumbleDryer()
+                    program = TumbleDryer(rng=rng)
                 elif self.name == 'WashingMachine':
-                    program = WashingMachine()
+                    program = WashingMachine(rng=rng)
                 elif self.name == 'DishWasher':
-                    program = DishWasher()
+                    program = DishWasher(rng=rng)
                 else:
                     raise ValueError(f"Currently only TumbleDryer, WashingMachine, and DishWasher programs encoded. Given: {self.name}")
 
@@ -748,7 +816,7 @@ class Equipment(object):
                 actdata= [stats.DTMC(clusterDict=clustersList[i]) for i in range(numOcc)] 
                 prob = occy   # just initiate correct size    
                 to = -1 # time counter for occupancy
-                for doy, step in itertools.product(range(nday), range(nbin)): #loop over year
+                for doy, step in steps(nday, offset, nbin): #loop over year
                     dow_i = dow[doy] # day of week (Monday=0)
                     to += 1
                     for i in range(numOcc): # get probability each occupant is performing the activity related to the appliance
@@ -759,7 +827,7 @@ class Equipment(object):
             tl = -1 # time counter for load (1min)
             left = [-1 for i in range(numOcc)] # time counter for appliance duration per occupant -> start as not used: -1
 
-            for doy, step in itertools.product(range(nday), range(nbin)): # loop over 10min steps in year
+            for doy, step in steps(nday, offset, nbin): # loop over 10min steps in year
                 dow_i = dow[doy] # day of week
                 to += 1  
                 # occupancy in 10 min, but for each occupancy step simulate 10 individual minutes for the loads.
@@ -786,15 +854,15 @@ class Equipment(object):
                             left[i] += -1   # count time down until cycle passed (for this occupant)          
                         else: # if it was not used by this occupant: left[i] <= 0 
                             # check if there is a state change in the appliance for this occupant
-                            if random.random() < prob[i][to] * self.cal: # if random number below calibration factor cal* probability of activity: start appliance
-                                left[i] = random.gauss(len_cycle, len_cycle/10) # start a cycle of random  duration for this occupant
+                            if rng.random() < prob[i][to] * self.cal: # if random number below calibration factor cal* probability of activity: start appliance
+                                left[i] = rng.gauss(len_cycle, len_cycle/10) # start a cycle of random  duration for this occupant
                                 if prog:
                                     if self.name == 'TumbleDryer':
-                                        program = TumbleDryer()
+                                        program = TumbleDryer(rng=rng)
                                     elif self.name == 'WashingMachine':
-                                        program = WashingMachine()
+                                        program = WashingMachine(rng=rng)
                                     elif self.name == 'DishWasher':
-                                        program = DishWasher()
+                                        program = DishWasher(rng=rng)
                                     else:
                                         raise ValueError(f"Currently only TumbleDryer, WashingMachine, and DishWasher programs encoded. Given: {self.name}")
                                     p_ts=0
@@ -822,13 +890,13 @@ class Equipment(object):
             n_eq = 0 # number of cycles for calibration of `cal` parameter of appliance
             
             # define length of cycles (same for entire year, assumed to depend on appliance)
-            len_cycle=random.gauss(self.cycle_length, self.cycle_length/10)
+            len_cycle=rng.gauss(self.cycle_length, self.cycle_length/10)
             # define duration of break between cycles (same for entire year)
-            delay=random.gauss(self.delay, self.delay/10)
+            delay=rng.gauss(self.delay, self.delay/10)
             
             # start as OFF (assumption)
             on=False #is it ON? 
-            left = random.gauss(delay/2, delay/4) # time left until change of state (initiate random)
+            left = rng.gauss(delay/2, delay/4) # time left until change of state (initiate random)
                        
             for tl in range(nmin+1): # loop over every minute of the year
                 # if there is time LEFT until change of state, remain as is
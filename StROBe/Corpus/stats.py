@@ -7,8 +7,11 @@ Created on Wed Oct 09 11:57:02 2013
 
 import numpy as np
 import random
+import bisect
+import functools
 
 import data
+import sampling
 
 
 def get_probability(rnd, prob, p_type='cum'):
@@ -45,49 +48,71 @@ def sum_dict(dict_a, dict_b):
     # and return
     return sum_dict
 
+class OccupancyModel(object):
+    '''
+    Comulative probabilities of the occupancy of a cluster, indexed by integers
+    rather than by the string keys of data.get_occDict():
+        - start[s-1]: start state s at 4:00 AM.
+        - transition[s-1][b-1]: next state, from state s ending in the 30-min bin b.
+        - duration[s-1][b-1]: duration of state s started in the 30-min bin b. [10-min steps]
+    Each is kept as nested lists, bisected for a single draw, and as arrays
+    (start_array, transition_array, duration_array) for the vectorized draws of batch_occupancy.
+    The start state is drawn from an alias table (start_table, see sampling.py).
+    '''
+    def __init__(self, cluster):
+        ds = data.get_occDict(cluster)
+        self.start = [float(ds['ss'][str(s)]) for s in range(1, 4)]
+        self.transition = [[ds['os_'+str(s)][str(b)].tolist() for b in range(1, 49)] for s in range(1, 4)]
+        self.duration = [[ds['ol_'+str(s)][str(b)].tolist() for b in range(1, 49)] for s in range(1, 4)]
+        self.start_array = np.array(self.start)
+        self.transition_array = np.array(self.transition)
+        self.duration_array = np.array(self.duration)
+        self.start_table = sampling.AliasTable(range(1, 4), np.diff(self.start_array, prepend=0))
+
+def occupancy_model(cluster):
+    '''
+    OccupancyModel of a cluster, created once per process.
+    '''
+    return load_occupancy_model(str(cluster))
+
+@functools.lru_cache(maxsize=None)
+def load_occupancy_model(cluster):
+    return OccupancyModel(cluster)
+
 class MCSA(object):
     '''
     The MCSA class defines a Monte Carlo Survival Analysis
     '''
     # All object parameters are given in kwargs
-    def __init__(self, cluster, **kwargs):
-        # load the dataset of the cluster into ds
-        ds = data.get_occDict(cluster)
-        # and add them as class parameters
-        self.OSS = ds['ss']
-        self.OPM = {1:ds['os_1'], 2:ds['os_2'], 3:ds['os_3']}
-        self.ODM = {1:ds['ol_1'], 2:ds['ol_2'], 3:ds['ol_3']}
-#        self.RED = ds['RED']
+    def __init__(self, cluster, rng=random, **kwargs):
+        # random generator from which the states and durations are drawn
+        self.rng = rng
+        # the probabilities of the cluster, indexed by integers
+        self.model = occupancy_model(cluster)
 
     def startstate(self):
         '''
         Get the startstate for first simulation day at 4:00 AM.
         '''
         # we define the startstate based on the given probability
-        probs = [self.OSS['1'], self.OSS['2'], self.OSS['3']]
-        state = get_probability(random.random(), probs)
-        # and retrun the value
-        return int(state)
+        return self.model.start_table.draw(self.rng)
 
+    # The draws below give the same values as get_probability() on the
+    # dictionaries, for the same random numbers: the index of the first
+    # comulative probability above the random number, plus one.
     def transition(self, state, timebin):
         '''
         Get next occupancy state from current state ending at time.
         '''
         # we define the new state based on the given probability
-        probs = self.OPM[state][str(timebin)]
-        newoc = get_probability(random.random(), probs)
-        # and retrun the value
-        return int(newoc)
+        return bisect.bisect_right(self.model.transition[int(state)-1][int(timebin)-1], self.rng.random()) + 1
 
     def duration(self, state, timebin):
         '''
         Get the duration of current state started at time.
         '''
         # we define the new duration based on the given probability
-        probs = self.ODM[state][str(timebin)]
-        durat = get_probability(random.random(), probs)
-        # and retrun the value
-        return durat
+        return bisect.bisect_right(self.model.duration[int(state)-1][int(timebin)-1], self.rng.random()) + 1
 
 
 class DTMC(object):
@@ -1,4 +1,3 @@
-from appliances_programs import TumbleDryer, WashingMachine
 set_appliances = \
 {
   "FridgeFreezer": {
@@ -359,8 +358,7 @@ set_appliances = \
     "consumption": 313.820216429956, 
     "delay": 0, 
     "activity": "drying", 
-    "type": "appliance",
-    "program":TumbleDryer(P=[0.5,0.5])
+    "type": "appliance"
   }, 
   "DishWasher": {
     "frad": 0.0, 
@@ -415,8 +413,7 @@ set_appliances = \
     "consumption": 191.041292123096, 
     "delay": 0, 
     "activity": "washing", 
-    "type": "appliance",
-    "program":WashingMachine(P=[0.5, 0.5])
+    "type": "appliance"
   }, 
   "Oven": {
     "frad": 0.17, 
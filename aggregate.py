@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+@author: noedi
+
+October 2026
+"""
+
+# Import required modules
+import numpy as np
+import xarray as xr
+
+
+def stack_profiles(frames):
+    '''
+    Stack the results of several households into a single (household x time x channel) array.
+    Households are aligned on the union of their time steps and channels: a channel that a
+    household does not have (eg. no EV) is filled with zeros.
+    Inputs:
+        - frames (iterable of pd.DataFrame): Consumption of each appliance at each time step, per household.
+    Outputs:
+        - stacked (xr.DataArray): Array of dimensions ('household', 'index', 'columns').
+    '''
+    arrays = [xr.DataArray(frame, dims=['index', 'columns']) for frame in frames]
+    return xr.concat(arrays, dim='household', join='outer', fill_value=0)
+
+
+class RunStatistics(object):
+    '''
+    Statistics of a run, updated as each household finishes so that its raw arrays can
+    be dropped right away: memory does not grow with the number of households (apart from
+    a few numbers per household).
+
+    Tracks:
+        - profiles: neighbourhood consumption of each channel at each time step. [W]
+        - household_energy: total energy consumed by each household over the horizon. [kWh]
+        - household_peak: peak demand of each household. [W]
+        - base_energy: energy of the appliances and lighting of each household, at a 1-min time step. [kWh]
+        - channel_energy: energy of each channel, summed over all households. [kWh]
+        - coincident_peak: peak demand of the whole neighbourhood. [W]
+    The channel profiles are reduced by chunks of 'chunk_size' households with stack_profiles().
+    '''
+
+    def __init__(self, ts, chunk_size=16):
+        self.ts = ts # time step of the channel profiles [min]
+        self.chunk_size = chunk_size
+        self.household_energy = dict()
+        self.household_peak = dict()
+        self.base_energy = dict()
+        self.pending = []
+        self.summed = None
+
+    def update(self, i, data, P):
+        '''
+        Add the results of household i.
+        Inputs:
+            - i (int): Index of the household.
+            - data (pd.DataFrame): Consumption of each channel at each time step. [W]
+            - P (np.ndarray): Appliances and lighting load at a 1-min time step. [W]
+        '''
+        total = data.sum(axis=1, skipna=True)
+        self.household_energy[i] = total.sum()*self.ts/60/1000
+        self.household_peak[i] = total.max()
+        self.base_energy[i] = np.sum(P)/60/1000
+        self.pending.append(data)
+        if len(self.pending) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        '''
+        Reduce the pending households into the neighbourhood profiles.
+        '''
+        if len(self.pending) == 0:
+            return
+        partials = [stack_profiles(self.pending).sum('household', skipna=True)]
+        if self.summed is not None:
+            partials.insert(0, self.summed)
+        self.summed = xr.concat(partials, dim='household', join='outer', fill_value=0).sum('household')
+        self.pending = []
+
+    def merge(self, other):
+        '''
+        Add the statistics of another run over different households, eg. another shard of
+        the same neighbourhood. Only the reduced profiles are combined: the results of the
+        households are not read again.
+        '''
+        if other.ts != self.ts:
+            raise ValueError(f"Cannot merge statistics with different time steps: {self.ts} and {other.ts} min.")
+        common = set(self.household_energy) & set(other.household_energy)
+        if len(common) > 0:
+            raise ValueError(f"Cannot merge statistics of the same households: {sorted(common)}")
+        self.flush()
+        other.flush()
+        if self.summed is None:
+            self.summed = other.summed
+        elif other.summed is not None:
+            self.summed = xr.concat([self.summed, other.summed], dim='household', join='outer', fill_value=0).sum('household')
+        self.household_energy.update(other.household_energy)
+        self.household_peak.update(other.household_peak)
+        self.base_energy.update(other.base_energy)
+
+    @property
+    def nb_households(self):
+        return len(self.household_energy)
+
+    @property
+    def profiles(self):
+        '''
+        Neighbourhood consumption of each channel at each time step. [W]
+        '''
+        self.flush()
+        df = self.summed.to_pandas()
+        df.index.name = 'DateTime'
+        df.columns.name = None
+        return df
+
+    def per_household(self, values):
+        '''
+        Per-household values, as an array ordered by household index.
+        '''
+        return np.array([values[i] for i in sorted(values)])
+
+    @property
+    def channel_energy(self):
+        '''
+        Energy of each channel, summed over all households. [kWh]
+        '''
+        return self.profiles.sum()*self.ts/60/1000
+
+    @property
+    def coincident_peak(self):
+        '''
+        Peak demand of the whole neighbourhood. [W]
+        '''
+        return self.profiles.sum(axis=1).max()
+
+    def summary(self):
+        '''
+        Dictionnary of the main statistics of the run.
+        '''
+        household_peak = self.per_household(self.household_peak)
+        coincident_peak = self.coincident_peak
+        return {'nb_households': self.nb_households,
+                'mean_energy': np.mean(self.per_household(self.household_energy)),
+                'std_energy': np.std(self.per_household(self.household_energy)),
+                'mean_base_energy': np.mean(self.per_household(self.base_energy)),
+                'mean_peak': np.mean(household_peak),
+                'coincident_peak': coincident_peak,
+                'coincidence_factor': coincident_peak/np.sum(household_peak),
+                'channel_energy': self.channel_energy.to_dict()}
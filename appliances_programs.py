@@ -6,9 +6,9 @@ September 2024
 """
 # NOT OPTIMAL BECAUSE PROFILES ARE COMPUTED AT EACH CALL!
 
-from scipy.interpolate import CubicSpline
-import matplotlib.pyplot as plt
 import numpy as np
+import random
+import sampling
 
 '''
 How does it works? 
@@ -26,14 +26,15 @@ generating a profile among 2 choices according to a predefined probability.
 Run this file to see plots of the programs. 
 '''
 
-def TumbleDryer(P=[0.5, 0.5]):
+def TumbleDryer(P=[0.5, 0.5], rng=random):
     
     '''
     Source: Mazidi, M., Malakhatka, E., Steen, D., & Wallbaum, H. (2023). Real-time rolling-horizon energy 
     management of public laundries: A case study in HSB living lab. Energy Conversion and Management: X, 20, 100462.
     '''
     
-    rand_choice = np.random.choice([1, 4], p=P)
+    from scipy.interpolate import CubicSpline # imported on first use, scipy is slow to import
+    rand_choice = sampling.choice([1, 4], P, rng)
 
     if rand_choice == 1:
         # Program 1
@@ -52,12 +53,13 @@ def TumbleDryer(P=[0.5, 0.5]):
         P4_y_interp = cs(P4_x_interp)
         return P4_y_interp    
 
-def WashingMachine(P=[0.5, 0.5]):
+def WashingMachine(P=[0.5, 0.5], rng=random):
     '''
     Source: Mazidi, M., Malakhatka, E., Steen, D., & Wallbaum, H. (2023). Real-time rolling-horizon energy 
     management of public laundries: A case study in HSB living lab. Energy Conversion and Management: X, 20, 100462.
     '''
-    rand_choice = np.random.choice([1, 4], p=P)
+    from scipy.interpolate import CubicSpline # imported on first use, scipy is slow to import
+    rand_choice = sampling.choice([1, 4], P, rng)
 
     if rand_choice == 1:
         # Program 1
@@ -77,12 +79,12 @@ def WashingMachine(P=[0.5, 0.5]):
         P4_y_interp = np.clip(P4_y_interp, a_min=1, a_max=None)
         return P4_y_interp     
 
-def DishWasher(P=[0.5, 0.5]):
+def DishWasher(P=[0.5, 0.5], rng=random):
     '''
     Source: Issi, F., & Kaplan, O. (2018). The determination of load profiles and power consumptions of 
     home appliances. Energies, 11(3), 607.
     '''
-    rand_choice = np.random.choice([1, 4], p=P)
+    rand_choice = sampling.choice([1, 4], P, rng)
 
     if rand_choice == 1:
         # Program 1 - 55°C economy program
@@ -107,6 +109,8 @@ def DishWasher(P=[0.5, 0.5]):
 
 
 def PLOT_TumbleDryer():
+    from scipy.interpolate import CubicSpline
+    import matplotlib.pyplot as plt
     # Program 1
     P1_x = np.array(range(5, 65, 5))
     P1_y = np.array([700, 1700, 1750, 1850, 1980, 1950, 2000, 1950, 2000, 1900, 1600, 500])
@@ -135,6 +139,8 @@ def PLOT_TumbleDryer():
     plt.show()
 
 def PLOT_WashingMachine():
+    from scipy.interpolate import CubicSpline
+    import matplotlib.pyplot as plt
     # Program 1
     P1_x = np.array(range(5, 145, 5))
     P1_y = np.array([300, 250, 250, 550, 500, 1200, 550, 150, 125, 100, 250, 150, 100, 1000, 1480, 1000, 1500, 100, 150, 100, 100, 150, 100, 500, 250, 400, 1450, 1070])
@@ -164,6 +170,7 @@ def PLOT_WashingMachine():
     plt.show()
 
 def PLOT_DishWasher():
+    import matplotlib.pyplot as plt
     # Program 1 - 55°C economy program
     P1_x = np.array(range(180)) # 3h program, in min
     water_heating_1 = [2250]*8 # 2250 W for 8 min
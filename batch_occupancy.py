@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+@author: noedi
+
+October 2026
+"""
+
+# Import required modules
+import os
+import sys
+import numpy as np
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'StROBe', 'Corpus'))
+import stats # by the name residential imports it with: one module, and one cache, per process
+
+DAY_TYPES = ['wkdy']*5 + ['sat', 'son'] # days of the typical week, each drawn from the cluster of its day type
+BINS = 144 # 10-min steps in a day
+
+
+class Tables(object):
+    '''
+    Occupancy tables (see stats.OccupancyModel) of several clusters stacked into arrays, the
+    first axis being the position of the cluster in 'clusters':
+        - start_tables: alias table of the start state of each cluster (see sampling.py)
+        - transition: (cluster, state, 30-min bin, next state)
+        - duration: (cluster, state, 30-min bin, duration)
+    '''
+
+    def __init__(self, clusters):
+        self.clusters = list(clusters)
+        models = [stats.occupancy_model(cluster) for cluster in self.clusters]
+        self.start_tables = [model.start_table for model in models]
+        self.transition = np.stack([model.transition_array for model in models])
+        self.duration = np.stack([model.duration_array for model in models])
+
+    def index(self, clusters):
+        '''
+        Positions of 'clusters' in the tables.
+        '''
+        position = {cluster: i for i, cluster in enumerate(self.clusters)}
+        return np.array([position[cluster] for cluster in clusters], dtype=int)
+
+
+def draw(cumulative, rnds):
+    '''
+    Draw a value from each row of 'cumulative' (comulative probabilities) with the random
+    numbers 'rnds', as stats.get_probability() does for a single row.
+    '''
+    return (cumulative <= rnds[:, None]).sum(axis=1) + 1
+
+def dayrun(tables, clusters, start, rng):
+    '''
+    Simulate a day of all the members at once, as Household.__occupancy__ does for each of them.
+    Inputs:
+        - tables (Tables): Occupancy tables of the clusters.
+        - clusters (array): Position of the cluster of each member in the tables.
+        - start (array): State of each member at the start of the day (4:00 AM).
+        - rng (numpy.random.Generator): Random generator of the draws.
+    Outputs:
+        - occs (array): Occupancy state of each member (rows) at each 10-min step (columns).
+    '''
+    occs = np.empty((len(start), BINS), dtype=np.int8)
+    state = np.asarray(start, dtype=int).copy()
+    occs[:, 0] = state
+    dt = draw(tables.duration[clusters, state-1, 0], rng.random(len(state)))
+    for tbin in range(1, BINS):
+        dt -= 1 # count down the duration of the current states
+        ended = np.flatnonzero(dt < 0) # states of which the duration ended with the previous step
+        if len(ended) > 0:
+            k, b = clusters[ended], tbin//3 # 30-min bin of the step
+            state[ended] = draw(tables.transition[k, state[ended]-1, b], rng.random(len(ended)))
+            # -1 is necessary, as the occupancy state already started
+            dt[ended] = draw(tables.duration[k, state[ended]-1, b], rng.random(len(ended))) - 1
+        occs[:, tbin] = state
+    return occs
+
+def simulate_weeks(clustersList, rng):
+    '''
+    Simulate the typical week of many members at once: five weekdays, a saturday and a sunday,
+    each drawn from the cluster of its day type and starting in the last state of the day before.
+    Inputs:
+        - clustersList (list): Clusters of each member ({'wkdy': .., 'sat': .., 'son': ..}, see
+        Household.clustersList).
+        - rng (numpy.random.Generator): Random generator of the draws.
+    Outputs:
+        - weeks (array): Occupancy state of each member (rows) at each 10-min step of the week,
+        starting on monday at 4:00 AM. (columns)
+    '''
+    weeks = np.empty((len(clustersList), 7*BINS), dtype=np.int8)
+    if len(clustersList) == 0:
+        return weeks
+    tables = Tables(sorted({member[day] for member in clustersList for day in ['wkdy', 'sat', 'son']}))
+    clusters = {day: tables.index([member[day] for member in clustersList]) for day in ['wkdy', 'sat', 'son']}
+    start = np.empty(len(clustersList), dtype=int)
+    for k, table in enumerate(tables.start_tables): # members of each cluster at once
+        members = np.flatnonzero(clusters['wkdy'] == k)
+        start[members] = np.asarray(table.values)[table.indices(rng.random(len(members)))]
+    for d, day in enumerate(DAY_TYPES):
+        weeks[:, d*BINS:(d+1)*BINS] = dayrun(tables, clusters[day], start, rng)
+        start = weeks[:, (d+1)*BINS-1]
+    return weeks
+
+def simulate_population(households, seed=None, rng=None):
+    '''
+    Simulate the typical week of all the members of many households at once.
+    The members are simulated together whatever their household, cluster or day type, so the
+    draws differ from those of Household.__occupancy__ (which draws from the stream of each
+    member), but they follow the same distributions.
+    Inputs:
+        - households (list): Clusters of the members of each household (see Household.clustersList).
+        - seed (int): Seed of the draws, if rng is not given.
+        - rng (numpy.random.Generator): Random generator of the draws.
+    Outputs:
+        - occ (list): Typical week of each member of each household (array of its members (rows)
+        at each 10-min step (columns)).
+        - occ_merged (array): Typical week of each household (rows), its members merged into
+        the most active state of all of them.
+    '''
+    rng = np.random.default_rng(seed) if rng is None else rng
+    sizes = [len(clustersList) for clustersList in households]
+    if min(sizes, default=1) == 0:
+        raise ValueError("Each household must have at least a member (older than 12) to simulate its occupancy.")
+    weeks = simulate_weeks([member for clustersList in households for member in clustersList], rng)
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(int)
+    occ = np.split(weeks, offsets[1:])
+    occ_merged = np.minimum.reduceat(weeks, offsets, axis=0) if len(households) > 0 else np.empty((0, 7*BINS), dtype=np.int8)
+    return occ, occ_merged
+
+def expand(week, dow, nday):
+    '''
+    Occupancy over the simulation period from a typical week, as Household.__occupancy__ does:
+    repeated every week, starting on the day of the week of the first day of the period.
+    Inputs:
+        - week (array): Typical week(s) (see simulate_population), the last axis being time.
+        - dow (list): Day of the week of each day of the period (see Household.dow).
+        - nday (int): Number of days of the period.
+    Outputs:
+        - occ (array): Occupancy at each 10-min step of the period, plus one step.
+    '''
+    tstart = BINS*dow[0]
+    tstop = tstart + BINS*nday + 1
+    repeats = int(np.ceil(tstop/week.shape[-1]))
+    return np.tile(week, repeats)[..., tstart:tstop]
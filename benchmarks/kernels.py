@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+@author: noedi
+
+October 2026
+"""
+
+# Import required modules
+import os
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import tracemalloc
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+import numpy as np
+import pandas as pd
+from Household_mod import Household_mod
+from StROBe.Corpus.residential import Equipment
+from StROBe.Data.Appliances import set_appliances
+from Hot_water import limit_power
+from heating_4 import House, simulate_heating_dynamics, outside_temperature, irradiation, weather_path
+from ramp_mobility.config_init_ import config_init_
+from ramp_mobility.EV_stoch_cons import EV_stoch_cons
+from ramp_mobility.EV_occ_daily_profile import EV_occ_daily_profile
+from Flexibility import flexibility_window
+from utils import occ_reshape
+from seeding import HouseholdStreams
+
+
+SEED = 42 # fixed seed of all the kernels
+HORIZONS = [1, 30, 365] # [day]
+YEAR = 2024
+MEMBERS = ['FTE', 'PTE'] # fixed dwelling composition of the benchmark household
+APPLIANCES = {"WashingMachine": 1, "TumbleDryer": 1, "DishWasher": 1, "WasherDryer": 0}
+
+
+class Fixture(object):
+    '''
+    Inputs of the kernels for a given horizon, all derived from the fixed seed:
+        - prepared: household after its chronology and occupancy, ie the inputs of Equipment.simulate().
+        - simulated: household after a complete simulation, for the kernels downstream of StROBe.
+    '''
+
+    def __init__(self, nb_days):
+        self.nb_days = nb_days
+        self.prepared = self.household()
+        self.prepared.__chronology__(YEAR, nb_days)
+        self.prepared.__occupancy__()
+        self.simulated = self.household()
+        self.simulated.simulate(year=YEAR, ndays=nb_days)
+        self.T_out_series = outside_temperature(weather_path)
+        self.house = House.generate(random.Random(SEED))
+        self.P_irr_series = irradiation(self.house, weather_path)
+        self.driver = config_init_('medium', 'normal', 'BE')
+        self.EV_cons = EV_stoch_cons(self.driver, nb_days, year=YEAR, country='BE', rng=random.Random(SEED))[0]
+
+    def household(self):
+        return Household_mod("Benchmark", members=MEMBERS, selected_appliances=APPLIANCES, streams=HouseholdStreams(SEED, 0))
+
+
+def equipment(name):
+    '''
+    Kernel of Equipment.simulate() for the given appliance.
+    '''
+    def kernel(fixture):
+        family = fixture.prepared
+        eq = Equipment(**set_appliances[name])
+        eq.simulate(family.nday, family.dow, family.clustersList, family.occ, rng=random.Random(SEED))
+    return kernel
+
+def occupancy(fixture):
+    '''
+    Occupancy of each member: a weekday, saturday and sunday drawn with stats.MCSA, repeated over the horizon.
+    '''
+    family = fixture.prepared
+    family.streams = HouseholdStreams(SEED, 0)
+    family.__occupancy__()
+
+def lighting(fixture):
+    '''
+    Plug loads without any appliance, ie lightingload() alone.
+    '''
+    family = fixture.prepared
+    family.streams = HouseholdStreams(SEED, 0)
+    apps = family.apps
+    family.apps = []
+    try:
+        family.__plugload__()
+    finally:
+        family.apps = apps
+
+def stochastic_flow(fixture):
+    '''
+    Hot water tappings of the shower, as in __dhwload__().
+    '''
+    family = fixture.prepared
+    eq = Equipment(name='showerFlow', **set_appliances['showerFlow'])
+    eq.simulate(family.nday, family.dow, [family.clustersList[0]], family.occ_m[0], rng=random.Random(SEED))
+
+def hot_water_limit(fixture):
+    '''
+    Hot_water.limit_power() on the boiler power of the simulated household, as in hot_water_elec_consumption().
+    '''
+    power = fixture.simulated.mDHW*(60-14)*4186/(0.9*3.6e3)*60
+    limit_power(power, 3e3)
+
+def heating(fixture):
+    '''
+    heating_4.simulate_heating_dynamics() with the set-points of the simulated household.
+    '''
+    simulate_heating_dynamics(fixture.house, fixture.nb_days, fixture.simulated.sh_day, fixture.T_out_series, fixture.P_irr_series, comfort=0.5, P_nom=8000)
+
+def ev(fixture):
+    '''
+    EV_occ_daily_profile() with the occupancy of the simulated household.
+    '''
+    occupancy = occ_reshape(fixture.simulated.occ_m, 10)
+    EV_occ_daily_profile(fixture.EV_cons, occupancy, fixture.driver, 7.4, SOC_init=0.9, rng=random.Random(SEED))
+
+def flexibility(fixture):
+    '''
+    Flexibility.flexibility_window() of the appliances with a program, within 4 hours.
+    '''
+    app_profile = pd.DataFrame(fixture.simulated.app_consumption)
+    app_profile = app_profile[[app for app in ['WashingMachine', 'TumbleDryer', 'DishWasher'] if app in app_profile.columns]]
+    flexibility_window(app_profile, fixture.simulated.occ_m, "Hours window", year=YEAR, flexibility_rate=4)
+
+
+# Kernels of the suite, each is called with the fixture of a horizon
+KERNELS = {'MCSA': occupancy,
+           'Equipment.cycle_load': equipment('FridgeFreezer'),
+           'Equipment.stochastic_load': equipment('TV1'),
+           'Equipment.program': equipment('WashingMachine'),
+           'lightingload': lighting,
+           'stochastic_flow': stochastic_flow,
+           'limit_power': hot_water_limit,
+           'simulate_heating_dynamics': heating,
+           'EV_occ_daily_profile': ev,
+           'flexibility_window': flexibility}
+
+
+def measure(kernel, fixture, repeat=3):
+    '''
+    Time of the kernel, the best of 'repeat' runs, and its peak memory, measured in a separate
+    run since tracing the allocations slows the kernel down.
+    Outputs:
+        - times (list): Execution time of each run. [s]
+        - peak_memory (int): Peak of the memory allocated during the run. [B]
+    '''
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        kernel(fixture)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        kernel(fixture)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return times, peak_memory
+
+def run_benchmarks(horizons=HORIZONS, kernels=None, repeat=3, disp=True):
+    '''
+    Run the kernels of the suite over the given horizons.
+    Inputs:
+        - horizons (list): Number of days simulated by the kernels.
+        - kernels (list): Names of the kernels to run (see KERNELS), all of them by default.
+        - repeat (int): Number of timed runs of each kernel.
+        - disp (bool): Displaying the results as they come.
+    Outputs:
+        - report (dict): Environment of the benchmark and, for each kernel and horizon,
+        its best and mean time [s] and its peak memory [B].
+    '''
+    kernels = list(KERNELS) if kernels is None else kernels
+    for name in kernels:
+        if name not in KERNELS:
+            raise ValueError(f"Unknown kernel: {name}. Available kernels: {list(KERNELS)}")
+
+    results = []
+    for nb_days in horizons:
+        fixture = Fixture(nb_days)
+        for name in kernels:
+            times, peak_memory = measure(KERNELS[name], fixture, repeat)
+            results.append({'kernel': name, 'nb_days': nb_days, 'repeat': repeat,
+                            'time': min(times), 'mean_time': float(np.mean(times)), 'peak_memory': peak_memory})
+            if disp:
+                print(f"{name:<28}{nb_days:>4} days: {min(times):10.4f} s {peak_memory/2**20:10.2f} MiB", file=sys.stderr)
+
+    return {'seed': SEED, 'members': len(MEMBERS), 'python': platform.python_version(), 'platform': platform.platform(),
+            'numpy': np.__version__, 'pandas': pd.__version__, 'results': results}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the simulation kernels with fixed seeds and horizons.")
+    parser.add_argument('--horizons', nargs='+', type=int, default=HORIZONS, help="Number of days simulated.")
+    parser.add_argument('--kernels', nargs='+', default=None, choices=list(KERNELS), help="Kernels to run, all by default.")
+    parser.add_argument('--repeat', type=int, default=3, help="Number of timed runs of each kernel.")
+    parser.add_argument('--output', default=None, help="JSON file of the results, printed if not given.")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.horizons, args.kernels, args.repeat)
+    if args.output is None:
+        print(json.dumps(report, indent=4))
+    else:
+        with open(os.path.join(ROOT, args.output), 'w') as file:
+            json.dump(report, file, indent=4)
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+@author: noedi
+
+October 2026
+"""
+
+# Import required modules
+import os
+import sys
+import json
+import argparse
+from benchmarks.startup import check
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+BASELINE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+
+# Benchmarks re-run by the gate, kept short enough to be run before every merge
+KERNEL_HORIZONS = [1, 30] # [day]
+SCALING_HOUSEHOLDS = [1, 10]
+SCALING_DAYS = [1]
+# Differences in time below MIN_TIME, or below NOISE_SPREADS times the spread of the timed runs
+# (mean minus best run, of the baseline and of the report), are measurement noise: kernels of a
+# few milliseconds vary by tens of percent between two runs of the same code.
+MIN_TIME = 1e-2 # [s]
+NOISE_SPREADS = 2
+MIN_MEMORY = 2**20 # [B] differences in memory below this are measurement noise
+
+
+def run_all(repeat=5):
+    '''
+    Run the kernel, end-to-end and startup benchmarks of the gate.
+    Outputs:
+        - report (dict): Reports of benchmarks.kernels ('kernels'), benchmarks.scaling ('scaling')
+        and benchmarks.startup ('startup'), and the hash of the sources they ran ('code', see
+        planner.code_sources), to flag a baseline older than the code.
+    '''
+    from benchmarks.kernels import run_benchmarks
+    from benchmarks.scaling import run_scaling
+    from benchmarks.startup import run_startup
+    from planner import code_sources
+    with open(os.path.join(ROOT, 'Config.json'), 'r', encoding="utf-8") as file:
+        base = json.load(file)
+    report = {'kernels': run_benchmarks(KERNEL_HORIZONS, repeat=repeat),
+              'scaling': run_scaling(dict(base, nb_workers=1), SCALING_HOUSEHOLDS, SCALING_DAYS, toggled=[]),
+              'startup': run_startup(repeat=repeat)}
+    import load_profiles # the end-to-end runs import it in their own process
+    report['code'] = code_sources()
+    return report
+
+def measures(report):
+    '''
+    Measures of a report, keyed by benchmark. Each is given as (value, higher_is_better, unit, spread),
+    the spread being the mean minus the best of the timed runs (0 if measured once).
+    '''
+    values = dict()
+    for result in report['kernels']['results']:
+        name = f"{result['kernel']} [{result['nb_days']} days]"
+        values[f"{name} time"] = (result['time'], False, 's', result.get('mean_time', result['time']) - result['time'])
+        values[f"{name} peak memory"] = (result['peak_memory'], False, 'B', 0)
+    for result in report['scaling']['results']:
+        name = f"simulate [{result['nb_households']} households, {result['nb_days']} days]"
+        values[f"{name} throughput"] = (result['households_per_second'], True, 'households/s', 0)
+        if result['peak_rss'] is not None:
+            values[f"{name} peak RSS"] = (result['peak_rss'], False, 'B', 0)
+    if 'startup' in report:
+        values[f"import {report['startup']['module']} time"] = (report['startup']['import_time'], False, 's', 0)
+    return values
+
+def compare(baseline, report, tolerance=0.25, memory_tolerance=0.25):
+    '''
+    Compare a report with the baseline.
+    Inputs:
+        - baseline, report (dict): Reports of run_all().
+        - tolerance (float): Relative slowdown allowed in time and throughput. [-]
+        - memory_tolerance (float): Relative increase allowed in memory. [-]
+    Outputs:
+        - regressions (list): Lines of the report of each benchmark that regressed beyond the tolerance.
+        - lines (list): Lines of the report of all the benchmarks.
+    '''
+    old, new = measures(baseline), measures(report)
+    regressions, lines = [], []
+    for key in old:
+        if key not in new:
+            continue
+        (before, higher_is_better, unit, spread), (after, _, _, new_spread) = old[key], new[key]
+        memory = unit == 'B'
+        allowed = memory_tolerance if memory else tolerance
+        if higher_is_better:
+            change = before/after - 1 if after > 0 else float('inf') # relative slowdown
+            noise = False
+        elif memory:
+            change = after/before - 1 if before > 0 else 0
+            noise = after - before < MIN_MEMORY
+        else:
+            change = after/before - 1 if before > 0 else 0
+            noise = after - before < max(MIN_TIME, NOISE_SPREADS*(spread + new_spread))
+        line = f"{key:<70} {before:14.6g} -> {after:14.6g} {unit:<13} {change:+8.1%}"
+        lines.append(line)
+        if change > allowed and not noise:
+            regressions.append(line)
+    return regressions, lines
+
+def gate(baseline_path=BASELINE, tolerance=0.25, memory_tolerance=0.25, repeat=5, update=False):
+    '''
+    Re-run the benchmarks and compare them with the baseline, or replace the baseline if 'update'.
+    Outputs:
+        - passed (bool): No benchmark regressed beyond the tolerance.
+    '''
+    report = run_all(repeat)
+    if update:
+        with open(baseline_path, 'w') as file:
+            json.dump(report, file, indent=4)
+        print(f"Baseline written to {baseline_path}.")
+        return True
+
+    if not os.path.exists(baseline_path):
+        raise ValueError(f"No baseline in {baseline_path}. Create it with --update.")
+    with open(baseline_path, 'r') as file:
+        baseline = json.load(file)
+    regressions, lines = compare(baseline, report, tolerance, memory_tolerance)
+    regressions += check(report['startup']) # import time budget and lazy dependencies
+
+    print("---- Performance compared with the baseline ----")
+    print('\n'.join(lines))
+    if baseline['kernels']['platform'] != report['kernels']['platform']:
+        print(f"Warning: the baseline was measured on {baseline['kernels']['platform']}.")
+    if len(regressions) > 0:
+        print(f"---- {len(regressions)} regression(s) beyond {tolerance:.0%} (time) / {memory_tolerance:.0%} (memory) ----")
+        print('\n'.join(regressions))
+        return False
+    print("No regression.")
+    return True
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Fail if the benchmarks regressed compared with the baseline.")
+    parser.add_argument('--baseline', default=BASELINE, help="Baseline file of timings and peak memory.")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Relative slowdown allowed, eg. 0.25 for 25%%.")
+    parser.add_argument('--memory-tolerance', type=float, default=0.25, help="Relative increase of memory allowed.")
+    parser.add_argument('--repeat', type=int, default=5, help="Number of timed runs of each kernel.")
+    parser.add_argument('--update', action='store_true', help="Replace the baseline with the current results.")
+    args = parser.parse_args()
+
+    passed = gate(os.path.join(ROOT, args.baseline), args.tolerance, args.memory_tolerance, args.repeat, args.update)
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+@author: noedi
+
+October 2026
+"""
+
+# Import required modules
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import itertools
+import subprocess
+import tempfile
+try:
+    import resource # not available on Windows
+except ImportError:
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+SEED = 42
+HOUSEHOLDS = [1, 10, 100, 1000]
+DAYS = [1, 30, 365]
+# Features toggled on and off in the grid, and their value when on
+FEATURES = {'HotWater': True, 'EV_presence': 1, 'SpaceHeating': True}
+OFF = {'HotWater': False, 'EV_presence': 0, 'SpaceHeating': False}
+
+
+def configurations(base, households=HOUSEHOLDS, days=DAYS, toggled=list(FEATURES)):
+    '''
+    Grid of configurations of the scaling benchmark: every number of households and of days,
+    with each toggled feature on and off. The other inputs are taken from 'base'.
+    Outputs:
+        - grid (list): Configurations, ie dictionnaries of inputs as in Config.json.
+    '''
+    grid = []
+    for nb_households, nb_days in itertools.product(households, days):
+        for states in itertools.product([True, False], repeat=len(toggled)):
+            config = dict(base, nb_households=nb_households, nb_days=nb_days, start_day=0, seed=SEED,
+                          plot=False, excel_export=False, resume=False, shard=None, instrumentation=False)
+            for feature, on in zip(toggled, states):
+                config[feature] = FEATURES[feature] if on else OFF[feature]
+            grid.append(config)
+    return grid
+
+def directory_size(directory):
+    '''
+    Total size of the files in a directory. [B]
+    '''
+    size = 0
+    for root, _, files in os.walk(directory):
+        size += sum(os.path.getsize(os.path.join(root, file)) for file in files)
+    return size
+
+def peak_rss():
+    '''
+    Peak resident memory of this process and of its largest worker process, None if unknown. [B]
+    '''
+    if resource is None:
+        return None, None
+    scale = 1 if sys.platform == 'darwin' else 1024 # ru_maxrss is in kB on Linux
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss*scale,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss*scale)
+
+def measure(config_path, output_path):
+    '''
+    Run a single configuration and write its measures to output_path. It is run in a
+    process of its own (see run_configuration), so that its peak memory is its own.
+    '''
+    sys.path.insert(0, ROOT)
+    from load_profiles import simulate
+
+    with open(config_path, 'r') as file:
+        config = json.load(file)
+    start = time.perf_counter()
+    simulate(config_path, disp=False)
+    wall_time = time.perf_counter() - start
+
+    rss, rss_workers = peak_rss()
+    with open(output_path, 'w') as file:
+        json.dump({'wall_time': wall_time,
+                   'households_per_second': config['nb_households']/wall_time,
+                   'peak_rss': rss,
+                   'peak_rss_workers': rss_workers,
+                   'output_size': directory_size(config['results_dir'])}, file)
+
+def run_configuration(config, directory):
+    '''
+    Run a configuration of the grid in a new process, with its results written in 'directory'.
+    Outputs:
+        - result (dict): Inputs of the configuration and its measures.
+    '''
+    config = dict(config, results_dir=os.path.join(directory, 'Results'))
+    config_path = os.path.join(directory, 'Config.json')
+    output_path = os.path.join(directory, 'measures.json')
+    with open(config_path, 'w') as file:
+        json.dump(config, file)
+    subprocess.run([sys.executable, '-m', 'benchmarks.scaling', '--measure', config_path, output_path],
+                   cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+    with open(output_path, 'r') as file:
+        measures = json.load(file)
+    shutil.rmtree(config['results_dir'], ignore_errors=True)
+
+    inputs = {key: config[key] for key in ['nb_households', 'nb_days', 'nb_workers', 'output_format'] + list(FEATURES)}
+    return dict(inputs, **measures)
+
+def run_scaling(base, households=HOUSEHOLDS, days=DAYS, toggled=list(FEATURES), disp=True):
+    '''
+    Run the whole grid of the scaling benchmark (see configurations).
+    Outputs:
+        - report (dict): Environment of the benchmark and, for each configuration, its throughput
+        [households/s], peak memory [B] and size of its results [B].
+    '''
+    results = []
+    for config in configurations(base, households, days, toggled):
+        with tempfile.TemporaryDirectory() as directory:
+            result = run_configuration(config, directory)
+        results.append(result)
+        if disp:
+            features = ' '.join(f"{feature}={config[feature]}" for feature in toggled)
+            rss = f"{result['peak_rss']/2**20:10.1f} MiB" if result['peak_rss'] is not None else ''
+            print(f"{config['nb_households']:>5} households {config['nb_days']:>4} days {features}: "
+                  f"{result['households_per_second']:8.3f} households/s {rss} {result['output_size']/2**20:10.2f} MiB on disk", file=sys.stderr)
+
+    return {'seed': SEED, 'python': platform.python_version(), 'platform': platform.platform(),
+            'cpu_count': os.cpu_count(), 'results': results}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the simulation over a grid of households x days x features.")
+    parser.add_argument('--config', default=os.path.join(ROOT, "Config.json"), help="Configuration of the other inputs.")
+    parser.add_argument('--households', nargs='+', type=int, default=HOUSEHOLDS, help="Numbers of households.")
+    parser.add_argument('--days', nargs='+', type=int, default=DAYS, help="Numbers of days.")
+    parser.add_argument('--toggle', nargs='*', default=list(FEATURES), choices=list(FEATURES),
+                        help="Features run both on and off. The others keep their value of the configuration.")
+    parser.add_argument('--output', default=None, help="JSON file of the results, printed if not given.")
+    parser.add_argument('--measure', nargs=2, default=None, metavar=('CONFIG', 'OUTPUT'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure is not None:
+        measure(*args.measure)
+    else:
+        with open(os.path.join(ROOT, args.config), 'r', encoding="utf-8") as file:
+            base = json.load(file)
+        report = run_scaling(base, args.households, args.days, args.toggle)
+        if args.output is None:
+            print(json.dumps(report, indent=4))
+        else:
+            with open(os.path.join(ROOT, args.output), 'w') as file:
+                json.dump(report, file, indent=4)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+@author: noedi
+
+October 2026
+"""
+
+# Import required modules
+import os
+import sys
+import json
+import platform
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+MODULE = 'load_profiles' # core simulation path, imported by run.py and by each worker process
+BUDGET = 0.4 # [s] import time allowed for MODULE
+# Heavy or optional dependencies that the core simulation path must only import when their feature is used
+LAZY = ['matplotlib', 'plotly', 'scipy']
+
+
+def import_times(module=MODULE):
+    '''
+    Import 'module' in a new interpreter with "python -X importtime".
+    Outputs:
+        - total (float): Import time of the module, including all its imports. [s]
+        - modules (dict): Cumulative import time of each module imported. [s]
+    '''
+    code = f"import sys; sys.path.insert(0, {ROOT!r}); import {module}"
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    modules = dict()
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        modules[name.strip()] = int(cumulative)*1e-6
+    return modules[module], modules
+
+def run_startup(module=MODULE, repeat=5, disp=True):
+    '''
+    Measure the import time of 'module', the best of 'repeat' new interpreters.
+    Outputs:
+        - report (dict): Environment of the benchmark, import time of the module [s], its slowest
+        direct and indirect imports [s], and the LAZY dependencies that it imported.
+    '''
+    runs = [import_times(module) for _ in range(repeat)]
+    total, modules = min(runs, key=lambda run: run[0])
+    slowest = sorted((name for name in modules if name != module), key=modules.get, reverse=True)[:10]
+    eager = sorted({name.split('.')[0] for name in modules} & set(LAZY))
+    if disp:
+        print(f"import {module}: {total:.3f} s (budget: {BUDGET} s)", file=sys.stderr)
+        for name in slowest:
+            print(f"    {name:<40}{modules[name]:8.3f} s", file=sys.stderr)
+    return {'module': module, 'python': platform.python_version(), 'platform': platform.platform(),
+            'import_time': total, 'slowest': {name: modules[name] for name in slowest}, 'eager': eager}
+
+def check(report, budget=BUDGET):
+    '''
+    Problems of a report of run_startup(): import time over the budget, or LAZY dependencies imported.
+    '''
+    problems = []
+    if report['import_time'] > budget:
+        problems.append(f"import {report['module']} took {report['import_time']:.3f} s, over the budget of {budget} s.")
+    for name in report['eager']:
+        problems.append(f"import {report['module']} imported {name}, which must only be imported when its feature is used.")
+    return problems
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Check the import time of the core simulation path against its budget.")
+    parser.add_argument('--module', default=MODULE, help="Module to import.")
+    parser.add_argument('--budget', type=float, default=BUDGET, help="Import time allowed. [s]")
+    parser.add_argument('--repeat', type=int, default=5, help="Number of new interpreters, the best one is kept.")
+    parser.add_argument('--output', default=None, help="JSON file of the results.")
+    args = parser.parse_args()
+
+    report = run_startup(args.module, args.repeat)
+    if args.output is not None:
+        with open(os.path.join(ROOT, args.output), 'w') as file:
+            json.dump(report, file, indent=4)
+    problems = check(report, args.budget)
+    print('\n'.join(problems) if len(problems) > 0 else "Within budget.")
+    sys.exit(1 if len(problems) > 0 else 0)
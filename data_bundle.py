@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+@author: noedi
+
+October 2026
+"""
+
+# Import required modules
+import os
+import glob
+import hashlib
+import tempfile
+import threading
+import numpy as np
+
+ROOT = os.path.dirname(os.path.realpath(__file__))
+STROBE_DATA = os.path.join(ROOT, 'StROBe', 'Data')
+WEATHER_PATH = os.path.join(ROOT, 'database', 'Meteo2022_Liege.xlsx')
+BUNDLE_PATH = os.path.join(ROOT, 'database', 'bundle.npz')
+
+# Version of the layout of the bundle: a bundle of another version is rebuilt
+VERSION = 1
+DAY_TYPES = ['wkdy', 'sat', 'son']
+OCCUPANCY_FILES = ['StartStates', 'TransitionProbability', 'DurationProbability']
+WEATHER_COLUMNS = ['Temperature C', 'I_north W/m²', 'I_south W/m²', 'I_west W/m²', 'I_east W/m²']
+
+# Arrays of the bundle of this process, loaded on first use
+_bundle = None
+_lock = threading.Lock()
+
+
+def sources():
+    '''
+    Source files of the bundle, in their authoring format (text and Excel files), by key of the bundle:
+        - crosstable.<day type>: Crosstables of the occupancy clusters of each employment type.
+        - occupancy.<cluster>.<file>: Start states, transition and duration probabilities of each occupancy cluster.
+        - activity.<cluster>: Activity proclivity functions of each cluster.
+        - irradiance: Global horizontal irradiance at a 1-minute time step.
+        - weather: Hourly weather of the space heating (its WEATHER_COLUMNS).
+    '''
+    files = dict()
+    occupancy = os.path.join(STROBE_DATA, 'Aerts_Occupancy')
+    for day in DAY_TYPES:
+        files[f'crosstable.{day}'] = os.path.join(occupancy, 'Crosstables', f'Crosstable_Employment_{day}.txt')
+    for directory in sorted(glob.glob(os.path.join(occupancy, 'Pattern*'))):
+        cluster = os.path.basename(directory)[len('Pattern'):]
+        for name in OCCUPANCY_FILES:
+            files[f'occupancy.{cluster}.{name}'] = os.path.join(directory, f'{name}.txt')
+    for path in sorted(glob.glob(os.path.join(STROBE_DATA, 'Aerts_Activities', 'Pattern*.txt'))):
+        files[f'activity.{os.path.basename(path)[len("Pattern"):-len(".txt")]}'] = path
+    files['irradiance'] = os.path.join(STROBE_DATA, 'Climate', 'irradiance.txt')
+    files['weather'] = WEATHER_PATH
+    return files
+
+def fingerprint(files):
+    '''
+    Fingerprint of the version of the bundle and of its sources (paths and contents): the bundle
+    is rebuilt when any source changes, but not when it is copied or checked out, which changes
+    the modification times only.
+    '''
+    digest = hashlib.sha1(str(VERSION).encode())
+    for key in sorted(files):
+        with open(files[key], 'rb') as file:
+            content = hashlib.sha1(file.read()).hexdigest()
+        digest.update(f"{key}:{os.path.relpath(files[key], ROOT).replace(os.sep, '/')}:{content};".encode())
+    return digest.hexdigest()
+
+def build(path=BUNDLE_PATH):
+    '''
+    Compile the sources into a single .npz bundle. The file is replaced atomically, so that
+    concurrent processes never read a partial bundle.
+    Outputs:
+        - path (str): Path of the bundle.
+    '''
+    import pandas as pd
+    files = sources()
+    arrays = dict()
+    for key, source in files.items():
+        if key == 'weather':
+            weather = pd.read_excel(source)
+            for column in WEATHER_COLUMNS:
+                arrays[f'weather.{column}'] = weather[column].to_numpy(dtype=float)
+        else:
+            arrays[key] = np.loadtxt(source, float)
+    arrays['fingerprint'] = np.array(fingerprint(files))
+
+    file, temporary = tempfile.mkstemp(suffix='.npz', dir=os.path.dirname(path))
+    try:
+        with os.fdopen(file, 'wb') as output:
+            np.savez(output, **arrays)
+        os.chmod(temporary, 0o644) # mkstemp creates the file readable by its owner only
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+    return path
+
+def read(path=BUNDLE_PATH):
+    '''
+    Arrays of the bundle, None if it is missing or out of date.
+    '''
+    if not os.path.exists(path):
+        return None
+    with np.load(path) as archive:
+        if 'fingerprint' not in archive.files or str(archive['fingerprint']) != fingerprint(sources()):
+            return None
+        arrays = {key: archive[key] for key in archive.files if key != 'fingerprint'}
+    for array in arrays.values():
+        array.flags.writeable = False # shared by all the households of the process
+    return arrays
+
+def load():
+    '''
+    Arrays of the bundle, read once per process. The bundle is (re)built first if it is
+    missing or out of date.
+    '''
+    global _bundle
+    if _bundle is None:
+        with _lock:
+            if _bundle is None:
+                arrays = read()
+                if arrays is None:
+                    build()
+                    arrays = read()
+                if arrays is None:
+                    raise ValueError(f"The data bundle {BUNDLE_PATH} is out of date right after being built: are its sources being modified?")
+                _bundle = arrays
+    return _bundle
+
+def get(key):
+    '''
+    Array 'key' of the bundle (see sources).
+    '''
+    return load()[key]
+
+
+if __name__ == '__main__':
+    print(f"Data bundle written to {build()}.")
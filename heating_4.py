@@ -2,9 +2,9 @@ import pandas as pd
 import numpy as np
 import os
 import random
-from scipy.integrate import solve_ivp
 from dataclasses import dataclass
-import matplotlib.pyplot as plt 
+from progress import message
+import data_bundle
 
 
 # Find the path to this file
@@ -51,8 +51,8 @@ class House:
     capacity_coefficients: CapacityCoefficients
 
     @staticmethod
-    def generate():
-        """Generate a random house and assign thermal properties"""
+    def generate(rng=random):
+        """Generate a random house and assign thermal properties, drawn from the random generator rng"""
         # Datasets
         construction_periods = ['< 45', '45-70', '70-90', '90-07', '> 08']
         floors = [1, 2, 3]
@@ -76,9 +76,9 @@ class House:
 
 
         # Randomly select properties
-        year_of_construction = random.choice(construction_periods)
-        n_floors = random.choice(floors)
-        ground_surface = random.choice(areas[n_floors])
+        year_of_construction = rng.choice(construction_periods)
+        n_floors = rng.choice(floors)
+        ground_surface = rng.choice(areas[n_floors])
         ceiling_height = heights[n_floors]/2
         
         # Derived properties
@@ -87,10 +87,10 @@ class House:
         wall_surface = round(perimeter * ceiling_height, 2)
         
         # Window surfaces
-        window_north = random.uniform(0.1, 0.2) * wall_surface / 4
-        window_south = random.uniform(0.1, 0.3) * wall_surface / 4
-        window_east = random.uniform(0.1, 0.3) * wall_surface / 4
-        window_west = random.uniform(0.1, 0.3) * wall_surface / 4
+        window_north = rng.uniform(0.1, 0.2) * wall_surface / 4
+        window_south = rng.uniform(0.1, 0.3) * wall_surface / 4
+        window_east = rng.uniform(0.1, 0.3) * wall_surface / 4
+        window_west = rng.uniform(0.1, 0.3) * wall_surface / 4
         window_tot = round(window_north+window_east+window_south+window_west, 2)        
         
         return House(
@@ -126,14 +126,19 @@ class House:
         print(f"Volume: {self.volume}")
         print(f"Total window surface: {self.tot_window_surface}")
 
+def read_weather(weather_path, column):
+    """Hourly values of a column of the weather file, from the data bundle for the default file."""
+    if os.path.realpath(weather_path) == os.path.realpath(data_bundle.WEATHER_PATH):
+        return data_bundle.get(f'weather.{column}')
+    return pd.read_excel(weather_path)[column].values
+
 def irradiation(house: House, weather_path):
     SF = 0.3    # Solar Factor
-    weather = pd.read_excel(weather_path)
     
-    irr_n = np.repeat(weather['I_north W/m²'].values, 6)
-    irr_e = np.repeat(weather['I_east W/m²'].values, 6)
-    irr_s = np.repeat(weather['I_south W/m²'].values, 6)
-    irr_w = np.repeat(weather['I_west W/m²'].values, 6)
+    irr_n = np.repeat(read_weather(weather_path, 'I_north W/m²'), 6)
+    irr_e = np.repeat(read_weather(weather_path, 'I_east W/m²'), 6)
+    irr_s = np.repeat(read_weather(weather_path, 'I_south W/m²'), 6)
+    irr_w = np.repeat(read_weather(weather_path, 'I_west W/m²'), 6)
 
     Q_dot_North = house.north_window_surface * irr_n * SF
     Q_dot_East = house.east_window_surface * irr_e * SF
@@ -143,8 +148,7 @@ def irradiation(house: House, weather_path):
     return Q_dot_North + Q_dot_East + Q_dot_West + Q_dot_South
 
 def outside_temperature(weather_path):
-    weather = pd.read_excel(weather_path)
-    return np.repeat(weather['Temperature C'].values, 6)  # Each 10 minutes
+    return np.repeat(read_weather(weather_path, 'Temperature C'), 6)  # Each 10 minutes
 
 def heat_loss(house, T_in, T_out, P_irradiation):
     """Calculate total heat losses including conduction and ventilation."""
@@ -188,6 +192,7 @@ def heating_dynamics(t, T_in, house: House, T_set, T_out, HP, P_nom, P_irr, comf
 
 def simulate_heating_dynamics(house, sim_days, T_set_series, T_out_series, P_irr_series, comfort=0.5, P_nom=8000):
     """Simulate space heating dynamics with controlled HP power."""
+    from scipy.integrate import solve_ivp # imported on first use, scipy is slow to import
     T0 = T_set_series[0]  # Initial indoor temperature
     HP0 = 0  # Initial HP power
     initial_guess = [T0, HP0]  # Initial temperature and HP power
@@ -244,15 +249,16 @@ def simulate_heating_dynamics(house, sim_days, T_set_series, T_out_series, P_irr
 
 
 
-def run_space_heating(T_set_series, sim_days):
-    """Run multiple simulations and compute average results for indoor temperature and HP power."""
+def run_space_heating(T_set_series, sim_days, rng=random):
+    """Run multiple simulations and compute average results for indoor temperature and HP power.
+    The house is drawn from the random generator rng."""
     
     # results_T = np.zeros(sim_days * 144)
     results = np.zeros(sim_days * 144)
 
     # comfort_study(sim_days, T_set_series)
 
-    house = House.generate()
+    house = House.generate(rng)
     T_out_series = outside_temperature(weather_path)  # External temperature series
     P_irr_series = irradiation(house, weather_path)  # Solar irradiation series
 
@@ -264,12 +270,13 @@ def run_space_heating(T_set_series, sim_days):
     total_power = results.sum()/4 # kWe (COP = 4)
     total_consumption = total_power / 6 # 6 is the number of time steps per hour
 
-    print("Price:", total_consumption*0.3, "€"," for ", sim_days, " days.") # 30 cts per kWh
+    message(f"Price: {total_consumption*0.3} € for {sim_days} days.") # 30 cts per kWh
     
     return results
 
 def comfort_study(sim_days, T_set_series):
     """Study the impact of comfort factor on heating dynamics."""
+    import matplotlib.pyplot as plt
     
     house = House.generate()
     P_irr_series = irradiation(house, weather_path)  # Solar irradiation series
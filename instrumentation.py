@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+@author: noedi
+
+October 2026
+"""
+
+# Import required modules
+import os
+import csv
+import json
+import time
+import threading
+import tracemalloc
+
+
+# Recorder of each thread (households may be simulated by concurrent threads), unset when disabled
+_local = threading.local()
+# Recorders enabled, by thread identifier, eg. for a sampling profiler running in another thread
+_recorders = dict()
+# tracemalloc was started by enable(), and must be stopped by disable()
+_started_tracing = False
+
+
+class Recorder(object):
+    '''
+    Execution time and number of calls of each stage of the simulation.
+    Stages can be nested: eg. 'receptacles' includes all the 'appliance.<name>' stages,
+    and 'household' includes all the stages of a household.
+    If 'memory' is set, the memory allocated by each stage is also traced with tracemalloc:
+        - peak_memory: largest increase of the allocated memory during a call of the stage. [B]
+        - retained_memory: memory still allocated at the end of the stage, summed over its calls. [B]
+    Tracing the memory slows the simulation down, so the times are then inflated.
+    '''
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.times = dict()
+        self.calls = dict()
+        self.peak_memory = dict()
+        self.retained_memory = dict()
+        self.active = [] # names of the stages running, the outermost first
+        self.stages = [] # stages running, when the memory is traced
+
+    def add(self, name, duration, calls=1, peak_memory=None, retained_memory=None):
+        '''
+        Record 'calls' calls of the stage 'name', that took 'duration' seconds in total.
+        '''
+        self.times[name] = self.times.get(name, 0) + duration
+        self.calls[name] = self.calls.get(name, 0) + calls
+        if peak_memory is not None:
+            self.peak_memory[name] = max(self.peak_memory.get(name, 0), peak_memory)
+            self.retained_memory[name] = self.retained_memory.get(name, 0) + retained_memory
+
+    def merge(self, other):
+        '''
+        Add the records of another recorder, eg. of another household or worker.
+        '''
+        for name in other.times:
+            self.add(name, other.times[name], other.calls[name],
+                     other.peak_memory.get(name), other.retained_memory.get(name))
+
+    def records(self):
+        '''
+        List of the records of each stage, the most time consuming first.
+        '''
+        total = self.times.get('household', 0)
+        records = []
+        for name in sorted(self.times, key=self.times.get, reverse=True):
+            record = {'stage': name,
+                      'calls': self.calls[name],
+                      'total_time': self.times[name],
+                      'mean_time': self.times[name]/self.calls[name],
+                      'share': self.times[name]/total if total > 0 else None}
+            if len(self.peak_memory) > 0:
+                record['peak_memory'] = self.peak_memory.get(name)
+                record['retained_memory'] = self.retained_memory.get(name)
+            records.append(record)
+        return records
+
+    def summary(self):
+        '''
+        Dictionnary of the records and of the throughput of a worker. [households/s]
+        '''
+        households = self.calls.get('household', 0)
+        total = self.times.get('household', 0)
+        return {'households': households,
+                'households_per_second': households/total if total > 0 else None,
+                'stages': self.records()}
+
+    def export(self, directory, name='instrumentation'):
+        '''
+        Write the records to 'name'.json (with the throughput) and 'name'.csv in the given directory.
+        '''
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"{name}.json"), 'w') as file:
+            json.dump(self.summary(), file, indent=4)
+        with open(os.path.join(directory, f"{name}.csv"), 'w', newline='') as file:
+            fieldnames = ['stage', 'calls', 'total_time', 'mean_time', 'share']
+            if len(self.peak_memory) > 0:
+                fieldnames += ['peak_memory', 'retained_memory']
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(self.records())
+
+
+class _Stage(object):
+    '''
+    Context manager that records the time spent in a stage.
+    '''
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+        self.peak = 0 # largest allocated memory before the last reset of the tracemalloc peak
+
+    def __enter__(self):
+        if self.recorder.memory:
+            # The peak of tracemalloc is reset for this stage: the stage around it keeps its peak so far.
+            self.start_memory, peak = tracemalloc.get_traced_memory()
+            if len(self.recorder.stages) > 0:
+                parent = self.recorder.stages[-1]
+                parent.peak = max(parent.peak, peak)
+            tracemalloc.reset_peak()
+            self.recorder.stages.append(self)
+        self.recorder.active.append(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        duration = time.perf_counter() - self.start
+        self.recorder.active.pop()
+        if self.recorder.memory:
+            self.recorder.stages.pop()
+            memory, peak = tracemalloc.get_traced_memory()
+            self.peak = max(self.peak, peak)
+            if len(self.recorder.stages) > 0:
+                parent = self.recorder.stages[-1]
+                parent.peak = max(parent.peak, self.peak)
+            self.recorder.add(self.name, duration, 1, self.peak - self.start_memory, memory - self.start_memory)
+        else:
+            self.recorder.add(self.name, duration)
+
+
+class _NoStage(object):
+    '''
+    Context manager that does nothing, used when the instrumentation is disabled.
+    '''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return None
+
+_NO_STAGE = _NoStage()
+
+
+def stage(name):
+    '''
+    Context manager that records the time and the call of the stage 'name' if the
+    instrumentation is enabled, and does nothing otherwise.
+    Example:
+        with stage('occupancy'):
+            self.__occupancy__()
+    '''
+    recorder = getattr(_local, 'recorder', None)
+    if recorder is None:
+        return _NO_STAGE
+    return _Stage(recorder, name)
+
+def active_stages(thread_id=None):
+    '''
+    Names of the stages running in the given thread (this one by default), the outermost
+    first (empty if disabled).
+    '''
+    recorder = _recorders.get(threading.get_ident() if thread_id is None else thread_id)
+    if recorder is None:
+        return []
+    return list(recorder.active)
+
+def enable(memory=False):
+    '''
+    Start recording the stages of this thread in a new recorder, and return it.
+    If 'memory' is set, the memory allocated by each stage is traced as well. tracemalloc
+    traces the whole process: the memory of concurrent threads cannot be told apart.
+    '''
+    global _started_tracing
+    _local.recorder = Recorder(memory)
+    _recorders[threading.get_ident()] = _local.recorder
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracing = True
+    return _local.recorder
+
+def disable():
+    '''
+    Stop recording in this thread, and return the recorder that was used (None if it was not enabled).
+    '''
+    global _started_tracing
+    recorder = getattr(_local, 'recorder', None)
+    _local.recorder = None
+    _recorders.pop(threading.get_ident(), None)
+    if _started_tracing:
+        tracemalloc.stop()
+        _started_tracing = False
+    return recorder
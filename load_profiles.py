@@ -17,67 +17,108 @@ from heating_4 import run_space_heating
 from utils import index_to_datetime, occ_reshape
 from Hot_water import hot_water_elec_consumption
 import time
-import random
 import json
-import xarray as xr
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from constant import StaticLoad
+from seeding import HouseholdStreams, new_master_seed
+import sampling
+from results_io import ResultWriter, clear_results, export_excel, household_path, save_checkpoint, load_checkpoint, OUTPUT_FORMATS
+from aggregate import RunStatistics
+import instrumentation
+from instrumentation import stage
+from planner import plan, display as display_plan
+from progress import Progress, Printer, capture, release, MODES as PROGRESS_MODES
 
+# Pools of workers that can simulate the households in parallel
+EXECUTORS = {'process': ProcessPoolExecutor, 'thread': ThreadPoolExecutor}
 
-def get_profiles(config, dwelling_compo):
+# Inputs of Config.json that do not change the results of a run
+RUN_OPTIONS = ['nb_workers', 'executor', 'resume', 'checkpoint_every', 'results_dir', 'excel_export', 'plot', 'instrumentation', 'memory_tracing', 'chunk_size', 'memory_budget', 'progress']
+
+
+def simulate_household(i, config, dwelling_compo):
     '''
-    Function that computes the different load profiles.
+    Function that computes the load profiles of a single household.
+    It only depends on its inputs so that it can run in any (worker) process.
 
     Inputs:
-        - config (dict): Dictionnay that contains all the inputs defined in Config.xlsx
+        - i (int): Index of the household in the neighbourhood.
+        - config (dict): Dictionnay that contains all the inputs defined in Config.json
         - dwelling_compo (list): Containing the dwelling composition.
-    
-    Outputs: 
-        - df (pd.DataFrame): Dataframe containing the results, ie for each time step, the consumption of each
-        appliance.
-        - times (np.ndarray): Execution time for each simulation.
-        - loads (np.ndarray): Total load during the simulation.
+
+    Outputs:
+        - data (pd.DataFrame): Consumption of each appliance at each time step, static loads merged in 'Base Load'.
+        - P (np.ndarray): Appliances and lighting load at a 1-min time step. [W]
+        - execution_time (float): Execution time of the simulation. [s]
+        - recorder (instrumentation.Recorder): Time and calls (and memory if 'memory_tracing') of each
+        stage of the simulation, None if 'instrumentation' and 'memory_tracing' are disabled.
+        - messages (list): Messages of the simulation (see progress.message), reported by the main process.
     '''
-    times = np.zeros(config['nb_households'])
+    start_time = time.time()
+    if config.get('instrumentation', False) or config.get('memory_tracing', False):
+        instrumentation.enable(memory=config.get('memory_tracing', False))
+    capture()
+    try:
+        with stage('household'):
+            data, P = household_profiles(i, config, dwelling_compo)
+    finally:
+        recorder = instrumentation.disable()
+        messages = release()
+    execution_time = time.time() - start_time
 
-    nminutes = config['nb_days'] * 1440 + 1
-    P = np.zeros((config['nb_households'], nminutes))
+    return data, P, execution_time, recorder, messages
 
-    for i in range(config['nb_households']):
-        start_time = time.time()
 
-        #---Household creation (Base Load) -------------
-        family = Household_mod(f"Scenario {i}", members=dwelling_compo, selected_appliances = config['appliances']) # print put in com 
-        family.simulate(year = config['year'], ndays = config['nb_days']) # print in com
-        df = pd.DataFrame(family.app_consumption)
-        #------------------------------
+def household_profiles(i, config, dwelling_compo):
+    '''
+    Simulation of a single household, see simulate_household().
+    '''
+    # Each component of the household draws from its own stream, derived from the master seed
+    # and the household index only: results do not depend on the process nor on the order.
+    streams = HouseholdStreams(config['seed'], i)
 
-        #---Space Heating -------------
-        shsetting_data = family.sh_day
-        heating_consumption = run_space_heating(shsetting_data, config['nb_days'])*1e3 #return an array with powers in kW every 10min, times 1000 to have the results in Watts
-        heating_cons_duplicate = [elem for elem in heating_consumption for _ in range(10)]   # To go from 10 to 1 min time step
-        heating_cons_duplicate = pd.Series(heating_cons_duplicate)/4                         #divided by the COP of conventional heat pump 
-        df['Heating'] = df.get('Heating', 0) + heating_cons_duplicate
-        #------------------------------
+    #---Household creation (Base Load) -------------
+    with stage('parameterize'):
+        family = Household_mod(f"Scenario {i}", members=dwelling_compo, selected_appliances = config['appliances'], streams=streams, occupancy_pool=config.get('occupancy_pool'), initiation_day=config.get('initiation_day', True)) # print put in com 
+    family.simulate(year = config['year'], ndays = config['nb_days']) # print in com
+    df = pd.DataFrame(family.app_consumption)
+    #------------------------------
 
-        #---Hot Water -------------
-        if config['HotWater']:
+    #---Space Heating -------------
+    if config.get('SpaceHeating', True):
+        with stage('space_heating'):
+            shsetting_data = family.sh_day
+            heating_consumption = run_space_heating(shsetting_data, config['nb_days'], rng=streams('heating'))*1e3 #return an array with powers in kW every 10min, times 1000 to have the results in Watts
+            heating_cons_duplicate = [elem for elem in heating_consumption for _ in range(10)]   # To go from 10 to 1 min time step
+            heating_cons_duplicate = pd.Series(heating_cons_duplicate)/4                         #divided by the COP of conventional heat pump 
+            df['Heating'] = df.get('Heating', 0) + heating_cons_duplicate
+    #------------------------------
+
+    #---Hot Water -------------
+    if config['HotWater']:
+        with stage('hot_water'):
             hot_water = hot_water_elec_consumption(pd.DataFrame({'mDHW':family.mDHW}), config['year'], config['HotWater_max_power'])
             df['HotWater'] = hot_water.tolist()
-        #------------------------------
+    #------------------------------
 
-        #---EV -------------
-        if config['EV_presence'] >= random.random():
+    #---EV -------------
+    with stage('ev'):
+        rng = streams('ev')
+        if config['EV_presence'] >= rng.random():
             # Reshaping of occupancy profile 
             occupancy = occ_reshape(family.occ_m, config['plot_ts'])
             # Determining EV parameter:
+            ev_config = dict(config) # the household parameters must not leak into the shared config
             sizes=['small', 'medium', 'large']
-            config['EV_size'] = np.random.choice(sizes, p=config['prob_EV_size'])
+            ev_config['EV_size'] = sampling.choice(sizes, config['prob_EV_size'], rng)
             usages=['short', 'normal', 'long']
-            config['EV_usage'] =  np.random.choice(usages, p=config['prob_EV_size'])
+            ev_config['EV_usage'] =  sampling.choice(usages, config['prob_EV_size'], rng)
             powers=[3.7, 7.4, 11, 22] #kW
-            config['EV_charger_power'] =  np.random.choice(powers, p=config['prob_EV_charger_power'])
+            ev_config['EV_charger_power'] =  sampling.choice(powers, config['prob_EV_charger_power'], rng)
             # Running EV module
-            load_profile, n_charge_not_home =EV_run(occupancy,config)
+            # Only the first household plots its EV profile (ramp_mobility/EV_plot.svg): the plot is slow, and each one would overwrite the last
+            load_profile, n_charge_not_home =EV_run(occupancy,ev_config, plot=config['plot'] and i == 0, rng=rng)
             EV_profile = pd.DataFrame({'EVCharging':load_profile})
             # EV_flex = pd.DataFrame({'EVCharging':load_profile, 'Occupancy':occupancy})
 
@@ -85,57 +126,208 @@ def get_profiles(config, dwelling_compo):
                 df['EVCharging'] =  EV_profile*1000
             else :
                 df['EVCharging'] = df['EVCharging'] + EV_profile['EVCharging']*1000
-        #------------------------------
-
-        #---Flexibility -------------
-        if config['flex_mode']: 
-            pass
-            # flex_window = flexibility_window(df[config['appliances'].keys()], family.occ_m, config['flex_mode'], flexibility_rate=config['flex_rate'])
-        #------------------------------
+    #------------------------------
 
-        
-        P[i,:] = family.P
-        end_time = time.time()
-        execution_time = end_time - start_time
-        times[i] = execution_time
-        print(f"Simulation {i+1}/{config['nb_households']} is done. Execution time: {execution_time} s.") 
+    #---Flexibility -------------
+    if config['flex_mode']: 
+        pass
+        # flex_window = flexibility_window(df[config['appliances'].keys()], family.occ_m, config['flex_mode'], flexibility_rate=config['flex_rate'])
+    #------------------------------
 
+    with stage('output'):
         df = index_to_datetime(df, config['year'],config['plot_ts'])
         StaticLoad_pres = [col for col in StaticLoad if col in df.columns]
         data=df.copy()
         data.loc[:, 'Base Load'] = data[StaticLoad_pres].sum(axis=1)
         data= data.drop(columns=StaticLoad_pres)
 
-        data_array = xr.DataArray(data, dims=['index', 'columns'], coords={'columns': data.columns}) 
-        if i == 0 :
-            dataset =  xr.Dataset({f'House {i}': data_array})
-        else :
-            dataset[f'House {i}'] = data_array
-    dataset.coords['index'] = data.index
+    return data, family.P
 
-    P = np.array(P)
-    
-    total_elec = np.sum(P)
-    average_total_elec = total_elec/config['nb_households']
-    loads=average_total_elec.sum()/60/1000
-    
-    #df = df/config['nb_households']
 
-    df = index_to_datetime(df, config['year'],config['plot_ts'])
+def get_profiles(config, dwelling_compo, results_dir, callback=None):
+    '''
+    Function that computes the different load profiles.
+    Households are simulated one after the other, or across a pool of 'nb_workers' processes
+    or threads (see 'executor').
+    Results are gathered in the order of the households in both cases, and each of them is
+    written to its own file of 'results_dir' as soon as it is available.
+    If 'instrumentation' is set, the time and calls of each stage, summed over the households,
+    are written to instrumentation.json and instrumentation.csv in 'results_dir'. If 'memory_tracing'
+    is set, the peak and retained memory of each stage are written as well.
+    Every 'checkpoint_every' households, the completed households and the statistics are saved
+    in 'results_dir'. If 'resume' is set, a run restarts from its last checkpoint and gives the
+    same results as an uninterrupted run.
+    If 'shard' is set, only the households of that shard are simulated (see shard_households).
+    The progress of the run (households done, stage, throughput and ETA) and the messages of the
+    simulation of each household are reported to 'callback' (see progress.Progress).
+
+    Inputs:
+        - config (dict): Dictionnay that contains all the inputs defined in Config.json
+        - dwelling_compo (list): Containing the dwelling composition.
+        - results_dir (str): Directory where the results of each household are written.
+        - callback (callable): Called with each progress event. By default, the events are printed
+        according to 'progress' (see progress.Printer).
     
-    return loads, times, dataset
+    Outputs: 
+        - statistics (RunStatistics): Statistics of the run, updated as each household finishes,
+        including the neighbourhood consumption of each appliance at each time step.
+        - times (np.ndarray): Execution time for each simulation.
+        - paths (list): Result files of the households, ie for each of them, the consumption of each
+        appliance at each time step (see results_io.read_household).
+    '''
+    checkpoint = load_checkpoint(results_dir) if config.get('resume', False) else None
+    if checkpoint is None:
+        clear_results(results_dir)
+        checkpoint = {'config': dict(config), 'completed': [], 'times': dict(),
+                      'statistics': RunStatistics(config['plot_ts'], config.get('chunk_size', 16)), 'recorder': instrumentation.Recorder()}
+    else:
+        check_resumable(checkpoint['config'], config)
+        checkpoint.setdefault('recorder', instrumentation.Recorder())
+    statistics = checkpoint['statistics']
+    checkpoint_every = config.get('checkpoint_every', 10)
+
+    nb_workers = config.get('nb_workers', 1)
+    shard = shard_households(config['nb_households'], config.get('shard'))
+    households = [i for i in shard if i not in set(checkpoint['completed'])]
+    progress = Progress(len(shard), len(shard) - len(households), Printer(config.get('progress', 'households')) if callback is None else callback)
+    progress.start()
+    if nb_workers > 1:
+        executor = EXECUTORS[config.get('executor', 'process')](max_workers=nb_workers)
+        results = executor.map(simulate_household, households, repeat(config), repeat(dwelling_compo))
+    else:
+        executor = None
+        results = map(simulate_household, households, repeat(config), repeat(dwelling_compo))
+
+    try:
+        with ResultWriter(results_dir, config.get('output_format', 'parquet')) as writer:
+            progress.set_stage('simulation')
+            for n, (i, (data, P, execution_time, recorder, messages)) in enumerate(zip(households, results)):
+                checkpoint['times'][i] = execution_time
 
+                progress.set_stage('statistics')
+                if recorder is not None: # the reduction of the household is recorded in this process
+                    instrumentation.enable(memory=config.get('memory_tracing', False))
+                with stage('statistics'):
+                    statistics.update(i, data, P)
+                if recorder is not None:
+                    checkpoint['recorder'].merge(recorder)
+                    checkpoint['recorder'].merge(instrumentation.disable())
+                progress.set_stage('writing')
+                writer.write(i, data)
+                checkpoint['completed'].append(i)
+                del data, P
+                if (n+1) % checkpoint_every == 0 or n+1 == len(households):
+                    progress.set_stage('checkpoint')
+                    writer.flush() # households are only recorded once their results are on disk
+                    save_checkpoint(results_dir, checkpoint)
+                    progress.checkpoint()
+                progress.household(i, execution_time, messages)
+                progress.set_stage('simulation')
+        progress.done()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    times = statistics.per_household(checkpoint['times'])
+    if config.get('instrumentation', False) or config.get('memory_tracing', False):
+        checkpoint['recorder'].export(results_dir)
+    paths = [household_path(results_dir, i, config.get('output_format', 'parquet')) for i in shard]
+    return statistics, times, paths
+
+
+def parse_shard(shard):
+    '''
+    Parse a shard specification "k/n", ie the k-th of n shards (1 <= k <= n).
+    Outputs:
+        - k, n (int): Shard number and number of shards.
+    '''
+    try:
+        k, n = [int(part) for part in shard.split('/')]
+    except (AttributeError, ValueError):
+        raise ValueError(f"Shard must be given as 'k/n', eg. '2/4'. Given: {shard}")
+    if not 1 <= k <= n:
+        raise ValueError(f"Shard number must be between 1 and the number of shards. Given: {shard}")
+    return k, n
+
+def shard_households(nb_households, shard=None):
+    '''
+    Indices of the households simulated by a shard: the household range is split in n contiguous
+    parts of (almost) equal size. The whole range is returned if shard is None.
+    As the random streams of a household only depend on its index and on the seed, a household
+    gives the same results whatever the shard that simulates it.
+    '''
+    if shard is None:
+        return range(nb_households)
+    k, n = parse_shard(shard)
+    return range((k-1)*nb_households//n, k*nb_households//n)
 
-def simulate(file_path, disp=True):
+def shard_dir(results_dir, shard):
+    '''
+    Results directory of a shard, inside the results directory of the whole run.
+    '''
+    k, n = parse_shard(shard)
+    return os.path.join(results_dir, f"shard_{k}_of_{n}")
+
+
+def check_resumable(previous, config):
+    '''
+    Check that a checkpoint made with the configuration 'previous' can be resumed with 'config':
+    all the inputs that change the results must be the same.
+    '''
+    for key in set(previous) | set(config):
+        if key not in RUN_OPTIONS and previous.get(key) != config.get(key):
+            raise ValueError(f"Cannot resume: '{key}' changed since the checkpoint ({previous.get(key)} -> {config.get(key)}). Set 'resume' to false to start a new run.")
+
+
+def simulate(file_path, disp=True, shard=None, callback=None):
     '''
     Simulation with a .json file.
     Input:
         - file (str): .json file path describing the configuration of the simulation.
         - disp (bool): Displaying informations about the simulation. 
+        - shard (str): Only simulate the shard "k/n" of the households, overrides 'shard' in the .json file.
+        Its results are written to a 'shard_k_of_n' folder of 'results_dir', to be combined with merge().
+        - callback (callable): Called with each progress event of the run (see get_profiles).
     Outputs: 
         - df (pd.DataFrame): Dataframe containing the results, ie for each time step, the consumption of each
         appliance.
     '''
+    config, dwelling_compo = read_config(file_path, shard)
+    if config.get('memory_budget') is not None:
+        # Workers and chunk size that fit in the memory budget
+        run_plan = plan(config, config['memory_budget'])
+        config.update(nb_workers=run_plan['nb_workers'], chunk_size=run_plan['chunk_size'])
+        if disp:
+            display_plan(config, run_plan, config['memory_budget'])
+
+    base_path = os.path.dirname(os.path.realpath(__file__))
+    results_dir = os.path.join(base_path, config.get('results_dir', 'Results'))
+    if config.get('shard') is not None:
+        results_dir = shard_dir(results_dir, config['shard'])
+    if config.get('seed') is None:
+        # Drawn once, so that all the workers share the same seed. A resumed run keeps its seed.
+        checkpoint = load_checkpoint(results_dir) if config.get('resume', False) else None
+        config['seed'] = new_master_seed() if checkpoint is None else checkpoint['config']['seed']
+    statistics, times, paths = get_profiles(config, dwelling_compo, results_dir, callback)
+
+    if config.get('excel_export', False):
+        export_excel(paths, os.path.join(results_dir, "Results.xlsx"))
+
+    df = statistics.profiles
+    report(config, statistics, times, disp)
+    return df
+
+
+def read_config(file_path, shard=None):
+    '''
+    Read and check the configuration of a simulation.
+    Inputs:
+        - file (str): .json file path describing the configuration of the simulation.
+        - shard (str): Shard "k/n" of the households to simulate, overrides 'shard' in the .json file.
+    Outputs:
+        - config (dict): Dictionnay that contains all the inputs defined in the .json file.
+        - dwelling_compo (list): Containing the dwelling composition.
+    '''
     with open(file_path, 'r', encoding="utf-8") as file: # 'utf-8' to avoid "é" issues
         config = json.load(file)  # Load the JSON data into a Python dictionary
 
@@ -151,28 +343,102 @@ def simulate(file_path, disp=True):
         raise ValueError(f"Probabilities associated to the charger powers are incorrect. {config['prob_EV_charger_power']}")
     if (config['nb_days'] + config['start_day'] > 365) or (config['nb_days'] <= 0): 
         raise ValueError(f"Declaration of time horizon incorrect: {config['nb_days']} days to simulate, starting from {config['start_day']}th day of the year.")
-    
-    loads, times, dataset = get_profiles(config, dwelling_compo)
+    if config.get('output_format', 'parquet') not in OUTPUT_FORMATS:
+        raise ValueError(f"Output format must be one of {OUTPUT_FORMATS}. Given: {config['output_format']}")
+    if config.get('nb_workers', 1) < 1:
+        raise ValueError(f"Number of workers must be at least 1: {config['nb_workers']}")
+    if config.get('executor', 'process') not in EXECUTORS:
+        raise ValueError(f"Executor must be one of {list(EXECUTORS)}. Given: {config['executor']}")
+    if config.get('executor', 'process') == 'thread' and config.get('nb_workers', 1) > 1 and config.get('memory_tracing', False):
+        raise ValueError("Memory tracing is process-wide: it cannot be used with several threads. Set 'executor' to 'process'.")
+    if config.get('occupancy_pool') is not None and (not isinstance(config['occupancy_pool'], int) or config['occupancy_pool'] < 1):
+        raise ValueError(f"The occupancy pool must hold at least 1 week, or be null to simulate the occupancy: {config['occupancy_pool']}")
+    if config.get('checkpoint_every', 10) < 1:
+        raise ValueError(f"Checkpoints must be saved at least every household: {config['checkpoint_every']}")
+    if config.get('progress', 'households') not in PROGRESS_MODES:
+        raise ValueError(f"Progress display must be one of {PROGRESS_MODES}. Given: {config['progress']}")
+    if config.get('chunk_size', 16) < 1:
+        raise ValueError(f"Chunk size must be at least 1 household: {config['chunk_size']}")
+    if shard is not None:
+        config['shard'] = shard
+    if config.get('shard') is not None:
+        k, n = parse_shard(config['shard'])
+        if n > config['nb_households']:
+            raise ValueError(f"Cannot split {config['nb_households']} households into {n} shards: some shards would be empty. Given: {config['shard']}")
+        if config.get('seed') is None:
+            raise ValueError("A 'seed' must be given to simulate a shard, so that all the shards share it.")
+
+    return config, dwelling_compo
+
+
+def merge(directories, output_dir=None, disp=True):
+    '''
+    Combine the results of the shards of a run into the results of the whole neighbourhood.
+    Only the statistics saved by each shard are read, not the results of the households.
+    Inputs:
+        - directories (list): Results directories of the shards (see shard_dir).
+        - output_dir (str): Directory where the merged statistics are saved as a checkpoint,
+        the parent directory of the first shard by default.
+        - disp (bool): Displaying informations about the simulation. 
+    Outputs: 
+        - df (pd.DataFrame): Dataframe containing the neighbourhood consumption of each appliance at each time step.
+    '''
+    checkpoints = []
+    for directory in directories:
+        checkpoint = load_checkpoint(directory)
+        if checkpoint is None:
+            raise ValueError(f"No results to merge in {directory}.")
+        checkpoints.append(checkpoint)
+
+    config = dict(checkpoints[0]['config'], shard=None)
+    statistics = RunStatistics(config['plot_ts'])
+    recorder = instrumentation.Recorder()
+    times = dict()
+    for directory, checkpoint in zip(directories, checkpoints):
+        try:
+            check_resumable(dict(checkpoint['config'], shard=None), config)
+        except ValueError as error:
+            raise ValueError(f"Shard {directory} is not part of the same run: {error}")
+        missing = set(shard_households(config['nb_households'], checkpoint['config'].get('shard'))) - set(checkpoint['completed'])
+        if len(missing) > 0:
+            raise ValueError(f"Shard {directory} is not finished: {len(missing)} households are missing. Resume it first.")
+        statistics.merge(checkpoint['statistics'])
+        recorder.merge(checkpoint.get('recorder', instrumentation.Recorder()))
+        times.update(checkpoint['times'])
+    if statistics.nb_households != config['nb_households']:
+        raise ValueError(f"Only {statistics.nb_households}/{config['nb_households']} households are covered by the given shards.")
 
-    file_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "Results.xlsx")
+    if output_dir is None:
+        output_dir = os.path.dirname(os.path.normpath(directories[0]))
+    os.makedirs(output_dir, exist_ok=True)
+    save_checkpoint(output_dir, {'config': config, 'completed': sorted(times), 'times': times, 'statistics': statistics, 'recorder': recorder})
+    if recorder.calls.get('household', 0) > 0:
+        recorder.export(output_dir)
 
-    with pd.ExcelWriter(file_path) as writer:
-        for idx in dataset.data_vars:
-            subset = dataset[idx].to_pandas()
-            subset.to_excel(writer, sheet_name=idx)
-    df = pd.DataFrame(0, index= range(0,len(dataset['index'].values)), columns=dataset['columns'].values)
-    for var in dataset.data_vars :
-        data_var = dataset[var].to_pandas()  
-        df += data_var.fillna(0)
-    df = df.set_index(dataset['index'].values)
+    df = statistics.profiles
+    report(config, statistics, statistics.per_household(times), disp)
+    return df
+
+
+def report(config, statistics, times, disp=True):
+    '''
+    Display the main statistics of a run and plot its neighbourhood load profile.
+    '''
+    df = statistics.profiles
 
     if disp: 
         print("---- Results ----")
         print("Time Horizon: ", config["nb_days"], "day(s).")
         print("Execution time [s]")
         print(f"\tMean: {np.mean(times)}")
+        loads = statistics.per_household(statistics.base_energy)
+        summary = statistics.summary()
         print("Total load [kWh]")
         print(f"\tMean: {round(np.mean(loads), 2)}; STD: {np.std(loads)}")
+        print("Total consumption, all appliances [kWh]")
+        print(f"\tMean: {round(summary['mean_energy'], 2)}; STD: {summary['std_energy']}")
+        print("Peak demand [kW]")
+        print(f"\tMean: {round(summary['mean_peak']/1000, 2)}; Coincident: {round(summary['coincident_peak']/1000, 2)}; Coincidence factor: {round(summary['coincidence_factor'], 2)}")
     
     if config['plot']:
-        make_demand_plot(df.index, df, title=f"Load profile for {config['nb_households']} households, for {config['nb_days']} days.")
\ No newline at end of file
+        make_demand_plot(df.index, df, title=f"Load profile for {statistics.nb_households} households, for {config['nb_days']} days.")
\ No newline at end of file
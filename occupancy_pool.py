@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+@author: noedi
+
+October 2026
+"""
+
+# Import required modules
+import os
+import glob
+import functools
+import tempfile
+import threading
+import numpy as np
+import data_bundle
+from batch_occupancy import simulate_weeks
+
+ROOT = os.path.dirname(os.path.realpath(__file__))
+POOL_DIR = os.path.join(ROOT, 'database', 'occupancy_pool')
+SEED = 0 # seed of all the pools: a pool is the same on every machine and for every run
+
+_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def data_fingerprint():
+    '''
+    Fingerprint of the occupancy data (see data_bundle.fingerprint), computed once per process.
+    '''
+    files = {key: path for key, path in data_bundle.sources().items() if key.startswith('occupancy.')}
+    return data_bundle.fingerprint(files)[:12]
+
+def pool_path(member, size, directory=POOL_DIR):
+    '''
+    File of the pool of a cluster combination. Its name holds the fingerprint of the data, so
+    that a pool is rebuilt (in a new file) when the occupancy data changes.
+    '''
+    return os.path.join(directory, f"weeks_{member['wkdy']}_{member['sat']}_{member['son']}_{size}_{data_fingerprint()}.npy")
+
+def build(member, size, path):
+    '''
+    Simulate a pool of 'size' typical weeks of a cluster combination (see batch_occupancy.simulate_weeks)
+    and save it. The file is replaced atomically, so that concurrent processes never read a partial pool.
+    The pools of previous versions of the data are removed.
+    '''
+    rng = np.random.default_rng([SEED, member['wkdy'], member['sat'], member['son'], size])
+    weeks = simulate_weeks([member]*size, rng)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    file, temporary = tempfile.mkstemp(suffix='.npy', dir=os.path.dirname(path))
+    try:
+        with os.fdopen(file, 'wb') as output:
+            np.save(output, weeks)
+        os.chmod(temporary, 0o644) # mkstemp creates the file readable by its owner only
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+    remove_stale(os.path.dirname(path))
+    return weeks
+
+def remove_stale(directory=POOL_DIR):
+    '''
+    Remove the pools simulated from another version of the occupancy data (see pool_path).
+    '''
+    for path in glob.glob(os.path.join(directory, 'weeks_*.npy')):
+        if not path.endswith(f"_{data_fingerprint()}.npy"):
+            try:
+                os.remove(path)
+            except FileNotFoundError: # removed by another process
+                pass
+
+def weeks(member, size):
+    '''
+    Pool of 'size' typical weeks of the cluster combination of a member ({'wkdy': .., 'sat': .., 'son': ..}),
+    read once per process, and simulated first if it is not on disk.
+    '''
+    return load(member['wkdy'], member['sat'], member['son'], size)
+
+@functools.lru_cache(maxsize=None)
+def load(wkdy, sat, son, size):
+    member = {'wkdy': wkdy, 'sat': sat, 'son': son}
+    path = pool_path(member, size)
+    with _lock:
+        pool = np.load(path) if os.path.exists(path) else build(member, size, path)
+    pool.flags.writeable = False # shared by all the households of the process
+    return pool
+
+def draw(member, size, rng):
+    '''
+    Typical week of a member, drawn uniformly from the pool of its cluster combination with 'rng'.
+    '''
+    pool = weeks(member, size)
+    return pool[rng.randrange(len(pool))]
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+@author: noedi
+
+October 2026
+"""
+
+# Import required modules
+import os
+import sys
+import json
+import hashlib
+import numpy as np
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'StROBe', 'Corpus'))
+from StROBe.Data.Appliances import set_appliances
+from StROBe.Corpus.residential import ownership
+from constant import special_appliances
+
+ROOT = os.path.dirname(os.path.realpath(__file__))
+# Default calibration: the reports of the kernel and scaling benchmarks (see benchmarks/regression.py)
+CALIBRATION = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+
+PROGRAMS = ['WashingMachine', 'TumbleDryer', 'DishWasher']
+MAX_CHUNK_SIZE = 64 # households reduced at once by RunStatistics
+MAX_PENDING = 2 # results waiting to be written (see results_io.ResultWriter)
+NB_CHANNELS = 8 # typical number of channels of the results of a household
+GiB = 2**30
+
+
+class Calibration(object):
+    '''
+    Cost coefficients of the stages of the simulation, calibrated by the benchmark suite:
+        - each kernel of benchmarks/kernels.py: time and peak memory, linear in the number of days,
+        fitted over the horizons of the report.
+        - the end-to-end runs of benchmarks/scaling.py: time per household that the kernels do not
+        cover (eg. parameterizing the household), and memory of a process before any household.
+    'stale' lists the sources changed since the benchmarks were run (see stale_sources).
+    '''
+
+    def __init__(self, report):
+        self.members = report['kernels'].get('members', 2) # members of the benchmark household
+        self.time, self.memory = dict(), dict()
+        kernels = dict()
+        for result in report['kernels']['results']:
+            kernels.setdefault(result['kernel'], []).append(result)
+        for kernel, results in kernels.items():
+            days = [result['nb_days'] for result in results]
+            self.time[kernel] = self.fit(days, [result['time'] for result in results])
+            self.memory[kernel] = self.fit(days, [result['peak_memory'] for result in results])
+
+        # Overhead of a household and memory of a process, from the largest end-to-end run
+        run = max(report['scaling']['results'], key=lambda result: result['nb_households'])
+        features = {'HotWater': run['HotWater'], 'EV_presence': run['EV_presence'], 'SpaceHeating': run['SpaceHeating'],
+                    'appliances': {app: set_appliances[app]['owner'] for app in PROGRAMS + ['WasherDryer']}}
+        self.overhead = 0
+        self.overhead = max(run['wall_time']/run['nb_households'] - self.household_time(features, run['nb_days'], 2), 0)
+        smallest = min(report['scaling']['results'], key=lambda result: result['nb_households'])
+        self.base_memory = smallest['peak_rss'] if smallest['peak_rss'] is not None else 256*2**20
+        # Sources changed since the calibration (None if the report does not record them)
+        self.stale = stale_sources(report['code']) if 'code' in report else None
+
+    @staticmethod
+    def fit(days, values):
+        '''
+        Coefficients (intercept, slope per day) of a value linear in the number of days.
+        '''
+        if len(set(days)) < 2:
+            return 0, values[0]/days[0]
+        slope, intercept = np.polyfit(days, values, 1)
+        return max(intercept, 0), max(slope, 0)
+
+    def kernel_time(self, kernel, nb_days):
+        intercept, slope = self.time[kernel]
+        return intercept + slope*nb_days
+
+    def kernel_memory(self, kernel, nb_days):
+        intercept, slope = self.memory[kernel]
+        return intercept + slope*nb_days
+
+    def components(self, config, nb_members):
+        '''
+        Expected number of calls of each kernel for a household of the configuration.
+        '''
+        counts = {'MCSA': nb_members/self.members, 'lightingload': 1, 'stochastic_flow': 4,
+                  'Equipment.cycle_load': 0, 'Equipment.stochastic_load': 0, 'Equipment.program': 0}
+        for app, parameters in set_appliances.items():
+            if parameters['type'] != 'appliance':
+                continue
+            if app in config['appliances']:
+                owner = float(config['appliances'][app])
+            elif app in special_appliances:
+                continue
+            else:
+                owner = ownership(app)
+            if parameters['activity'] == 'None':
+                counts['Equipment.cycle_load'] += owner
+            elif app in PROGRAMS:
+                counts['Equipment.program'] += owner
+            else:
+                counts['Equipment.stochastic_load'] += owner
+        if config['HotWater']:
+            counts['limit_power'] = 1
+        if config.get('SpaceHeating', True):
+            counts['simulate_heating_dynamics'] = 1
+        counts['EV_occ_daily_profile'] = float(config['EV_presence'])
+        return counts
+
+    def household_time(self, config, nb_days, nb_members):
+        '''
+        Expected time of the simulation of a household. [s]
+        '''
+        counts = self.components(config, nb_members)
+        return self.overhead + sum(count*self.kernel_time(kernel, nb_days) for kernel, count in counts.items() if kernel in self.time)
+
+    def household_memory(self, config, nb_days, nb_members):
+        '''
+        Expected peak memory of the simulation of a household: the largest peak of its kernels,
+        plus the 1-min arrays that the household keeps (one per appliance and per load), copied
+        once into a DataFrame. [B]
+        '''
+        counts = self.components(config, nb_members)
+        peak = max(self.kernel_memory(kernel, nb_days) for kernel, count in counts.items() if kernel in self.memory and count > 0)
+        nb_arrays = counts['Equipment.cycle_load'] + counts['Equipment.stochastic_load'] + counts['Equipment.program'] + 8
+        return peak + 2*nb_arrays*nb_days*1440*8
+
+
+def source_hash(path):
+    '''
+    Hash of the content of a source file (rather than its modification time, which a checkout changes).
+    '''
+    with open(path, 'rb') as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+def code_sources(modules=None):
+    '''
+    Hash of each source file of the project imported in the process, by path relative to the
+    project directory: the code that the benchmarks calibrating the costs have run (but the
+    benchmarks and the planner themselves).
+    '''
+    modules = sys.modules.values() if modules is None else modules
+    files = {os.path.realpath(module.__file__) for module in list(modules) if getattr(module, '__file__', None)}
+    benchmarks = os.path.join(ROOT, 'benchmarks') + os.sep
+    return {os.path.relpath(file, ROOT).replace(os.sep, '/'): source_hash(file) for file in sorted(files)
+            if file.startswith(ROOT + os.sep) and not file.startswith(benchmarks) and file.endswith('.py')
+            and file != os.path.realpath(__file__)}
+
+def stale_sources(code):
+    '''
+    Source files changed (or removed) since they were recorded by code_sources(): the costs
+    calibrated with them may no longer hold.
+    '''
+    stale = []
+    for name, digest in code.items():
+        path = os.path.join(ROOT, name)
+        if not os.path.exists(path) or source_hash(path) != digest:
+            stale.append(name)
+    return stale
+
+def load_calibration(path=CALIBRATION):
+    '''
+    Calibration from a report of benchmarks/regression.py ({'kernels': ..., 'scaling': ...}).
+    '''
+    with open(path, 'r') as file:
+        return Calibration(json.load(file))
+
+def result_memory(config):
+    '''
+    Memory of the results of a household, once resampled at 'plot_ts'. [B]
+    '''
+    return config['nb_days']*1440/config['plot_ts']*NB_CHANNELS*8
+
+def run_memory(calibration, config, nb_members, nb_workers, chunk_size):
+    '''
+    Expected peak memory of a run. [B]
+    The main process holds up to 'chunk_size' results waiting to be reduced (stacked once more
+    for the reduction), the neighbourhood profiles and the results waiting to be written. It
+    simulates the households itself if nb_workers is 1 or if the workers are threads, and each
+    worker process does otherwise, with the memory of a process of its own.
+    '''
+    results = (2*chunk_size + 1 + MAX_PENDING)*result_memory(config)
+    household = calibration.household_memory(config, config['nb_days'], nb_members)
+    if nb_workers > 1 and config.get('executor', 'process') == 'process':
+        household += calibration.base_memory
+    return calibration.base_memory + results + nb_workers*household
+
+def plan(config, memory_budget=None, calibration=None, nb_cpus=None):
+    '''
+    Plan a run: choose the number of workers and the chunk size of the reduction of the results
+    that fit in the memory budget, and predict its peak memory and wall time.
+    The most workers that fit are used (up to the number of CPUs and of households), then the
+    largest chunk that fits. Threads share the interpreter lock: their wall time is predicted
+    without any speedup.
+    Inputs:
+        - config (dict): Dictionnay that contains all the inputs defined in Config.json
+        - memory_budget (float): Memory available for the run. [GiB] No limit if None.
+        - calibration (Calibration): Cost coefficients, the committed benchmark baseline by default.
+        - nb_cpus (int): Number of CPUs available, all the CPUs of the machine by default.
+    Outputs:
+        - plan (dict): 'nb_workers', 'chunk_size', predicted 'peak_memory' [B], 'household_time' [s]
+        and 'wall_time' [s], whether the run 'fits' in the budget, and the 'stale_sources' changed
+        since the calibration (see Calibration.stale).
+    '''
+    calibration = load_calibration() if calibration is None else calibration
+    nb_cpus = os.cpu_count() if nb_cpus is None else nb_cpus
+    budget = float('inf') if memory_budget is None else memory_budget*GiB
+    nb_members = len([member for member in [config[f'dwelling_member{i+1}'] for i in range(config['dwelling_nb_compo'])] if member != 'U12'])
+
+    nb_workers, chunk_size = 1, 1
+    for workers in range(1, max(min(nb_cpus, config['nb_households']), 1) + 1):
+        if run_memory(calibration, config, nb_members, workers, 1) <= budget:
+            nb_workers = workers
+    for chunk in range(1, min(MAX_CHUNK_SIZE, config['nb_households']) + 1):
+        if run_memory(calibration, config, nb_members, nb_workers, chunk) <= budget:
+            chunk_size = chunk
+
+    household_time = calibration.household_time(config, config['nb_days'], nb_members)
+    peak_memory = run_memory(calibration, config, nb_members, nb_workers, chunk_size)
+    return {'nb_workers': nb_workers,
+            'chunk_size': chunk_size,
+            'peak_memory': peak_memory,
+            'household_time': household_time,
+            'wall_time': household_time*np.ceil(config['nb_households']/(nb_workers if config.get('executor', 'process') == 'process' else 1)),
+            'fits': peak_memory <= budget,
+            'stale_sources': calibration.stale}
+
+def display(config, run_plan, memory_budget=None):
+    '''
+    Display a plan made by plan().
+    '''
+    print("---- Run plan ----")
+    print(f"{config['nb_households']} households, {config['nb_days']} day(s).")
+    print(f"Workers: {run_plan['nb_workers']}; Chunk size: {run_plan['chunk_size']} households")
+    print(f"Peak memory: {round(run_plan['peak_memory']/GiB, 2)} GiB" + (f" (budget: {memory_budget} GiB)" if memory_budget is not None else ''))
+    print(f"Time per household: {round(run_plan['household_time'], 2)} s; Wall time: {round(run_plan['wall_time']/60, 1)} min")
+    if not run_plan['fits']:
+        print("Warning: even a single worker does not fit in the memory budget.")
+    if run_plan['stale_sources'] is None:
+        print("Warning: the calibration does not record the code it was measured on. Re-calibrate with: python -m benchmarks.regression --update")
+    elif len(run_plan['stale_sources']) > 0:
+        print(f"Warning: the calibration is older than the code of {', '.join(run_plan['stale_sources'])}. Re-calibrate with: python -m benchmarks.regression --update")
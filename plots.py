@@ -9,7 +9,6 @@ August 2024
 """
 
 # Import required modules
-import plotly.graph_objects as go
 from constant import defaultcolors, StaticLoad
 
 
@@ -32,6 +31,7 @@ def make_demand_plot(idx,data,PV = None,title='Consumption', NB_Scenario = 1):
 
     '''
     
+    import plotly.graph_objects as go # only imported to plot, it is slow to import
     fig = go.Figure()
     Base = list(set(data.columns) & set(StaticLoad))
     data["Base Load"] = data[Base].sum(axis=1)
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+@author: noedi
+
+October 2026
+"""
+
+# Import required modules
+import os
+import sys
+import time
+import random
+import pstats
+import cProfile
+import threading
+import instrumentation
+from load_profiles import read_config, simulate_household
+from seeding import new_master_seed
+
+ROOT = os.path.dirname(os.path.realpath(__file__))
+
+
+def source_path(filename):
+    '''
+    Readable path of a source file: relative to the project directory when inside it.
+    Files compiled from a relative path are resolved against the directories the modules
+    are imported from.
+    '''
+    if not os.path.isabs(filename):
+        for base in [ROOT, os.path.join(ROOT, 'StROBe', 'Corpus')]:
+            if os.path.isfile(os.path.join(base, filename)):
+                filename = os.path.join(base, filename)
+                break
+        else: # built-in ('~') or generated ('<string>') code
+            return filename
+    filename = os.path.realpath(filename)
+    if filename.startswith(ROOT + os.sep):
+        return os.path.relpath(filename, ROOT)
+    return filename
+
+
+class StackSampler(object):
+    '''
+    Sampling profiler of a thread: every 'interval' seconds, its call stack is recorded,
+    preceded by the stages of the pipeline that are running (see instrumentation.stage).
+    The samples are written in the collapsed-stack format of flame graphs, eg. for
+    flamegraph.pl or speedscope: one "frame;frame;...;frame count" line per stack.
+    '''
+
+    def __init__(self, thread_id=None, interval=0.001):
+        self.thread_id = threading.get_ident() if thread_id is None else thread_id
+        self.interval = interval
+        self.stacks = dict()
+        self.running = False
+        self.thread = None
+
+    def sample(self):
+        '''
+        Record the current stack of the sampled thread.
+        '''
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        frames = []
+        while frame is not None:
+            code = frame.f_code
+            frames.append(f"{code.co_name} ({source_path(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        stages = [f"[stage] {name}" for name in instrumentation.active_stages(self.thread_id)]
+        stack = ';'.join(stages + frames[::-1])
+        self.stacks[stack] = self.stacks.get(stack, 0) + 1
+
+    def run(self):
+        while self.running:
+            self.sample()
+            time.sleep(self.interval)
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        self.thread.join()
+
+    def write(self, path):
+        '''
+        Write the samples in the collapsed-stack format.
+        '''
+        with open(path, 'w') as file:
+            for stack, count in sorted(self.stacks.items()):
+                file.write(f"{stack} {count}\n")
+
+
+def readable_stats(profiler):
+    '''
+    Statistics of a cProfile run, with readable source paths (see source_path).
+    '''
+    stats = pstats.Stats(profiler)
+    readable = dict()
+    for (filename, line, name), (cc, nc, tt, ct, callers) in stats.stats.items():
+        callers = {(source_path(f), l, n): value for (f, l, n), value in callers.items()}
+        readable[(source_path(filename), line, name)] = (cc, nc, tt, ct, callers)
+    stats.stats = readable
+    return stats
+
+def profile_households(config, dwelling_compo, indices, directory, interval=0.001):
+    '''
+    Profile the simulation of the given households, one after the other in this process.
+    They are simulated twice, with the same results: once under cProfile and once under the
+    sampling profiler, so that the overhead of each one does not distort the other.
+    Written in 'directory':
+        - profile.pstats: cProfile statistics, eg. for pstats or snakeviz.
+        - profile.collapsed: collapsed stacks, the pipeline stages as their outermost frames.
+        - instrumentation.json/csv: time and calls of each stage (see instrumentation.Recorder).
+    Outputs:
+        - stats (pstats.Stats): cProfile statistics.
+    '''
+    os.makedirs(directory, exist_ok=True)
+    config = dict(config, instrumentation=True)
+
+    recorder = instrumentation.Recorder()
+    profiler = cProfile.Profile()
+    for i in indices:
+        profiler.enable()
+        household = simulate_household(i, config, dwelling_compo)
+        profiler.disable()
+        recorder.merge(household[3])
+        del household
+    stats = readable_stats(profiler)
+    stats.dump_stats(os.path.join(directory, "profile.pstats"))
+    recorder.export(directory)
+
+    sampler = StackSampler(interval=interval)
+    sampler.start()
+    try:
+        for i in indices:
+            simulate_household(i, config, dwelling_compo)
+    finally:
+        sampler.stop()
+    sampler.write(os.path.join(directory, "profile.collapsed"))
+    return stats
+
+def profile(file_path, nb_profiled=1, directory=None, disp=True):
+    '''
+    Profile 'nb_profiled' households of the configuration of a .json file, drawn among all its
+    households with its seed.
+    Inputs:
+        - file_path (str): .json file path describing the configuration of the simulation.
+        - nb_profiled (int): Number of households to profile.
+        - directory (str): Directory of the profiles, the 'profile' folder of 'results_dir' by default.
+        - disp (bool): Displaying the most time consuming functions.
+    Outputs:
+        - stats (pstats.Stats): cProfile statistics.
+    '''
+    config, dwelling_compo = read_config(file_path)
+    if config.get('seed') is None:
+        config['seed'] = new_master_seed()
+    if not 1 <= nb_profiled <= config['nb_households']:
+        raise ValueError(f"Number of households to profile must be between 1 and {config['nb_households']}. Given: {nb_profiled}")
+    if directory is None:
+        directory = os.path.join(ROOT, config.get('results_dir', 'Results'), 'profile')
+    indices = sorted(random.Random(config['seed']).sample(range(config['nb_households']), nb_profiled))
+
+    stats = profile_households(config, dwelling_compo, indices, directory)
+    if disp:
+        print(f"---- Profile of households {indices} (seed {config['seed']}) ----")
+        stats.sort_stats('cumulative').print_stats(20)
+        print(f"Profiles written to {directory}.")
+    return stats
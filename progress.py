@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+@author: noedi
+
+October 2026
+"""
+
+# Import required modules
+import sys
+import time
+import threading
+
+
+# Messages of the household being simulated by each thread, unset when they are not captured
+_local = threading.local()
+
+# Displays of the progress, see Printer
+MODES = ['households', 'summary', 'none']
+
+
+def message(text):
+    '''
+    Report a message of the simulation of a household (eg. the energy that the boiler could not
+    deliver). It is delivered with the household to the progress callback when captured (see
+    capture), and printed otherwise, eg. when a module is run on its own.
+    '''
+    messages = getattr(_local, 'messages', None)
+    if messages is None:
+        print(text)
+    else:
+        messages.append(str(text))
+
+def capture():
+    '''
+    Start capturing the messages of this thread.
+    '''
+    _local.messages = []
+
+def release():
+    '''
+    Stop capturing, and return the messages captured (empty if they were not captured).
+    '''
+    messages = getattr(_local, 'messages', None)
+    _local.messages = None
+    return [] if messages is None else messages
+
+
+class Progress(object):
+    '''
+    Progress of a run, reported to 'callback' as events. Each event is a dictionnary with:
+        - event: 'start', 'stage', 'household', 'message', 'checkpoint' or 'done'.
+        - households_done, nb_households: Households done so far (including those of a resumed
+        checkpoint), and to simulate in total.
+        - stage: What the main process is doing: 'simulation' (waiting for a household, simulated
+        in this process or in a worker), 'statistics', 'writing' or 'checkpoint'.
+        - households_per_second: Throughput since the start of this run, None before the first household.
+        - eta: Expected time before the end of the run [s], None before the first household.
+        - elapsed: Time since the start of this run. [s]
+    'household' and 'message' events also have 'household' (its index), and respectively its
+    'execution_time' [s] and the 'message'.
+    '''
+
+    def __init__(self, nb_households, households_done=0, callback=None):
+        self.nb_households = nb_households
+        self.households_done = households_done
+        self.callback = Printer() if callback is None else callback
+        self.done_this_run = 0
+        self.stage = None
+        self.start_time = time.perf_counter()
+
+    def throughput(self):
+        '''
+        Households done per second since the start of this run, None before the first one.
+        '''
+        elapsed = time.perf_counter() - self.start_time
+        if self.done_this_run == 0 or elapsed <= 0:
+            return None
+        return self.done_this_run/elapsed
+
+    def emit(self, event, **fields):
+        throughput = self.throughput()
+        remaining = self.nb_households - self.households_done
+        self.callback(dict({'event': event,
+                            'households_done': self.households_done,
+                            'nb_households': self.nb_households,
+                            'stage': self.stage,
+                            'households_per_second': throughput,
+                            'eta': remaining/throughput if throughput is not None else None,
+                            'elapsed': time.perf_counter() - self.start_time}, **fields))
+
+    def start(self):
+        self.start_time = time.perf_counter()
+        self.emit('start')
+
+    def set_stage(self, name):
+        self.stage = name
+        self.emit('stage')
+
+    def household(self, i, execution_time, messages=()):
+        '''
+        Report a household done, and the messages of its simulation.
+        '''
+        self.households_done += 1
+        self.done_this_run += 1
+        for text in messages:
+            self.emit('message', household=i, message=text)
+        self.emit('household', household=i, execution_time=execution_time)
+
+    def checkpoint(self):
+        self.emit('checkpoint')
+
+    def done(self):
+        self.stage = None
+        self.emit('done')
+
+
+class Printer(object):
+    '''
+    Default progress callback, that prints the events according to 'mode':
+        - 'households': a line per household, with the throughput and the ETA, and the messages of its simulation.
+        - 'summary': a line every 10% of the households, without the messages.
+        - 'none': nothing.
+    '''
+
+    def __init__(self, mode='households', file=None):
+        if mode not in MODES:
+            raise ValueError(f"Progress display must be one of {MODES}. Given: {mode}")
+        self.mode = mode
+        self.file = sys.stdout if file is None else file
+        self.next_summary = None
+
+    def __call__(self, event):
+        if self.mode == 'none':
+            return
+        done, total = event['households_done'], event['nb_households']
+        if event['event'] == 'start':
+            if done > 0:
+                print(f"Resuming from checkpoint: {done}/{total} households already done.", file=self.file)
+            self.next_summary = done
+        elif event['event'] == 'message' and self.mode == 'households':
+            print(f"Household {event['household']+1}: {event['message']}", file=self.file)
+        elif event['event'] == 'household':
+            if self.mode == 'summary':
+                if done < self.next_summary and done < total:
+                    return
+                while self.next_summary <= done:
+                    self.next_summary += max(total//10, 1)
+            line = f"{done}/{total} households done."
+            if self.mode == 'households':
+                line = f"Household {event['household']+1} is done. Execution time: {round(event['execution_time'], 3)} s. {line}"
+            print(f"{line} {event['households_per_second']:.3g} households/s, ETA: {format_duration(event['eta'])}.", file=self.file)
+
+
+def format_duration(seconds):
+    '''
+    Duration as "h:mm:ss".
+    '''
+    if seconds is None:
+        return '?'
+    seconds = int(round(seconds))
+    return f"{seconds//3600}:{seconds%3600//60:02d}:{seconds%60:02d}"
@@ -9,6 +9,7 @@ August 2024
 import numpy as np
 import random 
 from typing import Any
+import sampling
 
 
 def prob_charge_notHome_fun(E_journey, E_leaving):
@@ -32,7 +33,7 @@ def prob_charge_notHome_fun(E_journey, E_leaving):
     return P
     
 
-def EV_occ_daily_profile(EV_cons: np.ndarray[Any, np.dtype[np.float_]], full_occupancy: np.ndarray[Any, np.dtype[np.bool_]], Driver: object, charger_power: float, SOC_init=0.9, disp=False):
+def EV_occ_daily_profile(EV_cons: np.ndarray[Any, np.dtype[np.float_]], full_occupancy: np.ndarray[Any, np.dtype[np.bool_]], Driver: object, charger_power: float, SOC_init=0.9, disp=False, rng=random):
     '''
     Function returning an array containing daily profile which splits the stochastic
     EV capacities given by EV_stochastic.py according to a occupancy profile input.
@@ -42,6 +43,7 @@ def EV_occ_daily_profile(EV_cons: np.ndarray[Any, np.dtype[np.float_]], full_occ
         - User (class User()): User profile to simulate.
         - SOC_init (float [0.0; 1.0]): Initial State Of Charge of the EV battery.
         - disp (boolean): To get information displayed on the console.
+        - rng (random.Random): Random generator of the EV draws.
     Outputs:
         - SOC_profile (float np.array [0.0; 1.0]): State of charge profile during the day.
         - charging_profile (boolean np.array): EV plugging profile. (1: Plugged; 0: Not plugged)
@@ -62,7 +64,7 @@ def EV_occ_daily_profile(EV_cons: np.ndarray[Any, np.dtype[np.float_]], full_occ
     # The charge that occurs outside home is not always the same that home charger
     available_stations=[7.4, 11, 22, 50] # [kW], level 2 and 3 of EV chargers,see source in readme.txt
     prob_stations=[0.3, 0.35, 0.3, 0.05]
-    station_power = np.random.choice(available_stations, p=prob_stations)
+    station_power = sampling.choice(available_stations, prob_stations, rng)
 
     EV = Driver.App_list[0]
     battery_cap = EV.Battery_cap # [kWh]
@@ -123,7 +125,7 @@ def EV_occ_daily_profile(EV_cons: np.ndarray[Any, np.dtype[np.float_]], full_occ
                     #print("Dep:", departures[i], "-", i)
                     t_departure = departures[i][0]
                     ratio = t_departure/tot_time_left
-                    stoch_ratio = round(ratio * random.uniform((1-var_split),(1+var_split)), 2)
+                    stoch_ratio = round(ratio * rng.uniform((1-var_split),(1+var_split)), 2)
                     E_spent = EV_cons[iteration]*stoch_ratio
                     departures[i].append(E_spent)
                     
@@ -132,8 +134,8 @@ def EV_occ_daily_profile(EV_cons: np.ndarray[Any, np.dtype[np.float_]], full_occ
                     E_leaving = SOC_last*battery_cap
                     P_ch_notHome = prob_charge_notHome_fun(E_spent, E_leaving)
                                 
-                    if random.random() <= P_ch_notHome:
-                        t_charge = round(r_ch_notHome*t_departure*random.uniform((1-var_ch_notHome),(1+var_ch_notHome))) # Stochastic charge time [min]
+                    if rng.random() <= P_ch_notHome:
+                        t_charge = round(r_ch_notHome*t_departure*rng.uniform((1-var_ch_notHome),(1+var_ch_notHome))) # Stochastic charge time [min]
                         E_charge = station_power / 60 * t_charge * eff # [kWh]
                         E_arrive = E_leaving-E_spent+E_charge
                         
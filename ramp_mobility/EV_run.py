@@ -7,9 +7,9 @@ August 2024
 
 # Import required modules
 import os
+import random
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from ramp_mobility.EV_stoch_cons import EV_stoch_cons
 from ramp_mobility.EV_occ_daily_profile import EV_occ_daily_profile
 from ramp_mobility.config_init_ import config_init_
@@ -17,7 +17,7 @@ from typing import Any
 
 
 
-def EV_run(occupancy: np.ndarray[Any, np.dtype[np.bool_]], config: dict, plot=True)-> pd.DataFrame:
+def EV_run(occupancy: np.ndarray[Any, np.dtype[np.bool_]], config: dict, plot=True, rng=random)-> pd.DataFrame:
     '''
     Code based on ramp-mobility library that computes stochastic Electrical 
     Vehicle load profile for predefined types of user, on yearly or daily basis.
@@ -27,6 +27,8 @@ def EV_run(occupancy: np.ndarray[Any, np.dtype[np.bool_]], config: dict, plot=Tr
     The config variable is a dictionnary containing whole configuration used in the simulation. 
     config = {'nb_days'-'start_day'-'country'-'year'-'car'-'usage'-'charger_power'}
 
+    All the random draws of the EV are made from the random generator rng.
+
     Please refer to the file main.py/base_load.py for further explanations.
     '''
 
@@ -46,14 +48,15 @@ def EV_run(occupancy: np.ndarray[Any, np.dtype[np.bool_]], config: dict, plot=Tr
 
     Driver = config_init_(car, usage, country)
 
-    EV_cons, EV_dist, EV_time = EV_stoch_cons(Driver, nb_days, year=year, country=country, start_day=start_day)
+    EV_cons, EV_dist, EV_time = EV_stoch_cons(Driver, nb_days, year=year, country=country, start_day=start_day, rng=rng)
 
-    SOC, bin_charg, EV_refilled, load_profile = EV_occ_daily_profile(EV_cons, occupancy, Driver, charger_pow, SOC_init=0.9)
+    SOC, bin_charg, EV_refilled, load_profile = EV_occ_daily_profile(EV_cons, occupancy, Driver, charger_pow, SOC_init=0.9, rng=rng)
     n_charge_not_home = np.count_nonzero(EV_refilled)
 
     #df_load_profile.to_excel('EV_load_profile.xlsx', index=False)
 
     if plot:
+        import matplotlib.pyplot as plt # only imported to plot, it is slow to import
         fig, axs = plt.subplots(4, 1, figsize=(10, 8), sharex=True)
         # Plot SOC
         axs[0].plot(SOC, color='blue')
@@ -9,8 +9,9 @@ August 2024
 import numpy as np
 import random 
 from ramp_mobility.config_init_ import yearly_pattern 
+from progress import message
 
-def EV_stoch_cons(Driver: object, nb_days: int, year=2024, country='BE', start_day=0)->set:
+def EV_stoch_cons(Driver: object, nb_days: int, year=2024, country='BE', start_day=0, rng=random)->set:
     '''
     Function that computes stochastic data (EV daily consumption, daily time and distance) from config_init_.py 
     corresponding to Belgium case. Other files (for other countries) should be properly modified. 
@@ -21,6 +22,7 @@ def EV_stoch_cons(Driver: object, nb_days: int, year=2024, country='BE', start_d
         - country ['AT'...'UK']: Country used in the simulation. Currently only available for 'BE': BELGIUM.
         - day_type ['weekday', 'saturday', 'sunday']: Indicate when simulating on a single day the type.
         - start_day (int): Number of the day in {year} to start the simulation.  
+        - rng (random.Random): Random generator of the EV draws.
     Outputs:
         - list_EV_caps (np.ndarray float): Containing stochastic data, EV daily consumption.
         - list_dists (np.ndarray float): Containing stochastic data, daily distance.
@@ -47,19 +49,19 @@ def EV_stoch_cons(Driver: object, nb_days: int, year=2024, country='BE', start_d
                 day_type = 'sunday'
         else:
             day_type='weekday'
-            print("Default day type used: weekday.")
+            message("Default day type used: weekday.")
         
         # Selecting the appliance linked to to right day type.
         App = [App for App in Driver.App_list if App.day_type == day_type]
         if len(App) != 1: raise ValueError(f"Error in EV_stochastic.py, {len(App)} appliance.s linked to the same day type ({day_type}).")
         App = App[0]
         
-        random_var_v = random.uniform((1-App.r_v),(1+App.r_v))
-        random_var_d = random.uniform((1-App.r_d),(1+App.r_d))
+        random_var_v = rng.uniform((1-App.r_v),(1+App.r_v))
+        random_var_d = rng.uniform((1-App.r_d),(1+App.r_d))
 
-        rand_dist = round(random.uniform(App.dist_tot,int(App.dist_tot*random_var_d))) 
+        rand_dist = round(rng.uniform(App.dist_tot,int(App.dist_tot*random_var_d))) 
         App.vel = App.func_dist/App.func_cycle * 60 
-        rand_vel = np.maximum(20, round(random.uniform(App.vel,int(App.vel*random_var_v)))) #average velocity of the trip, minimum value is 20 km/h to get reasonable values from the power curve
+        rand_vel = np.maximum(20, round(rng.uniform(App.vel,int(App.vel*random_var_v)))) #average velocity of the trip, minimum value is 20 km/h to get reasonable values from the power curve
         rand_time = int(round(rand_dist/rand_vel * 60))  #Function to calculate the total time based on total distance and average velocity 
                                                 
         power = (App.Par_power[0] * rand_vel**2 + App.Par_power[1] * rand_vel + App.Par_power[2]) * 12
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+@author: noedi
+
+October 2026
+"""
+
+# Import required modules
+import os
+import re
+import glob
+import queue
+import _pickle as cPickle
+import shutil
+import threading
+import pandas as pd
+import xarray as xr
+
+
+# Binary formats of the household result files
+OUTPUT_FORMATS = ['parquet', 'hdf5', 'netcdf']
+
+EXCEL_MAX_ROWS = 1048576 # including the header row
+
+
+def household_path(directory, i, output_format='parquet'):
+    '''
+    Path of the result file of household i in the given directory.
+    Parquet files are partitioned by household (one 'household=i' folder each), so that
+    the directory can also be read as a single dataset, eg. with pd.read_parquet(directory).
+    '''
+    if output_format == 'parquet':
+        return os.path.join(directory, f"household={i}", "part-0.parquet")
+    elif output_format == 'hdf5':
+        return os.path.join(directory, f"house_{i:05d}.h5")
+    elif output_format == 'netcdf':
+        return os.path.join(directory, f"house_{i:05d}.nc")
+    raise ValueError(f"Output format must be one of {OUTPUT_FORMATS}. Given: {output_format}")
+
+def household_index(path):
+    '''
+    Index of the household of a result file (see household_path).
+    '''
+    matches = re.findall(r'(?:household=|house_)(\d+)', path)
+    if len(matches) == 0:
+        raise ValueError(f"Not the result file of a household: {path}")
+    return int(matches[-1]) # the last one, the directories above may match too
+
+def write_household(path, data):
+    '''
+    Write the results of a single household, in the format given by the extension of path.
+    Inputs:
+        - path (str): Path of the file to write (see household_path).
+        - data (pd.DataFrame): Consumption of each appliance at each time step.
+    '''
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if path.endswith('.parquet'):
+        data.to_parquet(path, compression='snappy')
+    elif path.endswith('.h5'):
+        data.to_hdf(path, key='power', mode='w', format='fixed', complevel=5, complib='blosc:zstd')
+    else:
+        data_array = xr.DataArray(data, dims=['index', 'columns'], coords={'index': data.index.values, 'columns': data.columns})
+        data_array.to_dataset(name='power').to_netcdf(path)
+
+def read_household(path):
+    '''
+    Read the results of a single household written by write_household().
+    Outputs:
+        - data (pd.DataFrame): Consumption of each appliance at each time step.
+    '''
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    elif path.endswith('.h5'):
+        return pd.read_hdf(path, key='power')
+    with xr.open_dataset(path) as dataset:
+        data = dataset['power'].load().to_pandas()
+    data.index.name = 'DateTime'
+    data.columns.name = None
+    return data
+
+def clear_results(directory):
+    '''
+    Remove the household result files of a previous run from the given directory.
+    '''
+    for path in glob.glob(os.path.join(directory, "house_*.*")) + glob.glob(os.path.join(directory, "checkpoint.p")):
+        os.remove(path)
+    for path in glob.glob(os.path.join(directory, "household=*")):
+        shutil.rmtree(path)
+
+def save_checkpoint(directory, checkpoint):
+    '''
+    Save the checkpoint of a run in its results directory. The file is replaced atomically,
+    so an interrupted run always leaves the previous checkpoint or the new one.
+    Inputs:
+        - directory (str): Results directory of the run.
+        - checkpoint (dict): 'config' of the run, 'completed' household indices, their execution
+        'times' and the 'statistics' of the completed households.
+    '''
+    path = os.path.join(directory, "checkpoint.p")
+    with open(path + '.tmp', 'wb') as file:
+        cPickle.dump(checkpoint, file)
+    os.replace(path + '.tmp', path)
+
+def load_checkpoint(directory):
+    '''
+    Load the checkpoint saved by save_checkpoint(), or None if the directory has none.
+    '''
+    path = os.path.join(directory, "checkpoint.p")
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as file:
+        return cPickle.load(file)
+
+def export_excel(paths, file_path):
+    '''
+    Export the results of the households to an Excel file, one sheet per household, named
+    after the index of the household (as in household_path).
+    Only meant for small runs: this is much slower than the binary formats, and a sheet
+    cannot hold more than about 2 years at a 1-min time step.
+    '''
+    with pd.ExcelWriter(file_path) as writer:
+        for path in paths:
+            data = read_household(path)
+            if len(data) >= EXCEL_MAX_ROWS:
+                raise ValueError(f"Results of {len(data)} time steps do not fit in an Excel sheet ({EXCEL_MAX_ROWS} rows). Use a larger 'plot_ts' or disable 'excel_export'.")
+            data.to_excel(writer, sheet_name=f'House {household_index(path)}')
+
+
+class ResultWriter(object):
+    '''
+    Write the results of each household to its own file as soon as it is simulated,
+    so that the results of the whole neighbourhood never have to fit in memory.
+    Writing runs in a background thread and overlaps with the simulation of the
+    next household. At most 'max_pending' results wait in memory to be written.
+    '''
+
+    def __init__(self, directory, output_format='parquet', max_pending=2):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.output_format = output_format
+        self.paths = []
+        self.error = None
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def write(self, i, data):
+        '''
+        Queue the results of household i for writing and return the path of its file.
+        '''
+        if self.error is not None:
+            raise self.error
+        path = household_path(self.directory, i, self.output_format)
+        self.queue.put((path, data))
+        self.paths.append(path)
+        return path
+
+    def run(self):
+        '''
+        Body of the background thread: write the queued results until close() is called.
+        '''
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            if self.error is None:
+                try:
+                    write_household(*item)
+                except Exception as error:
+                    self.error = error
+            self.queue.task_done()
+
+    def flush(self):
+        '''
+        Wait until all queued results are written, without stopping the writer.
+        '''
+        self.queue.join()
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        '''
+        Wait until all queued results are written.
+        '''
+        self.queue.put(None)
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -6,9 +6,39 @@ September 2024
 """
 
 # Import required modules
-from load_profiles import simulate
 import os
+from load_profiles import simulate, merge
+import argparse
+
+ROOT = os.path.dirname(os.path.realpath(__file__))
+
 if __name__ == '__main__':
-    path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "Config.json")
-    simulate(path, disp=True)
-    
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Simulate the load profiles of a neighbourhood.")
+    parser.add_argument('--config', default=os.path.join(ROOT, "Config.json"),
+                        help="Path of the configuration file.")
+    parser.add_argument('--shard', default=None,
+                        help="Only simulate the shard k/n of the households, eg. 2/4. A 'seed' must be set in the configuration.")
+    parser.add_argument('--merge', nargs='+', default=None, metavar='DIR',
+                        help="Merge the results directories of all the shards of a run instead of simulating.")
+    parser.add_argument('--output', default=None,
+                        help="Directory of the merged statistics (with --merge) or of the profiles (with --profile).")
+    parser.add_argument('--profile', type=int, default=None, metavar='N',
+                        help="Profile N households drawn with the seed, instead of simulating the whole neighbourhood.")
+    parser.add_argument('--plan', action='store_true',
+                        help="Only predict the peak memory and wall time of the run, and the workers and chunk size that fit in 'memory_budget'.")
+    args = parser.parse_args()
+    # relative paths are given from the project directory, as 'results_dir'
+    path = lambda p: None if p is None else os.path.join(ROOT, p)
+
+    if args.merge is not None:
+        merge([path(directory) for directory in args.merge], output_dir=path(args.output), disp=True)
+    elif args.plan:
+        from load_profiles import read_config
+        from planner import plan, display
+        config, _ = read_config(path(args.config))
+        display(config, plan(config, config.get('memory_budget')), config.get('memory_budget'))
+    elif args.profile is not None:
+        from profiling import profile
+        profile(path(args.config), args.profile, directory=path(args.output), disp=True)
+    else:
+        simulate(path(args.config), disp=True, shard=args.shard)
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+@author: noedi
+
+October 2026
+"""
+
+# Import required modules
+import random
+import functools
+import numpy as np
+
+
+class AliasTable(object):
+    '''
+    Categorical distribution of 'values' with the probabilities 'weights' (normalized), prepared
+    with the alias method of Vose: each draw takes a single random number and a constant time,
+    whatever the number of values.
+    The values are split into as many columns of equal probability: column i holds value i with
+    probability prob[i] and value alias[i] otherwise.
+    '''
+
+    def __init__(self, values, weights):
+        self.values = list(values)
+        weights = np.asarray(weights, dtype=float)
+        if len(self.values) == 0 or len(self.values) != len(weights):
+            raise ValueError(f"A probability must be given for each value. Given: {len(self.values)} values, {len(weights)} probabilities")
+        if (weights < 0).any() or weights.sum() <= 0:
+            raise ValueError(f"Probabilities must be positive, and not all zero. Given: {weights.tolist()}")
+        n = len(weights)
+        scaled = weights*n/weights.sum()
+        prob = np.ones(n)
+        alias = np.arange(n)
+        small = [i for i in range(n) if scaled[i] < 1]
+        large = [i for i in range(n) if scaled[i] >= 1]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s], alias[s] = scaled[s], l
+            scaled[l] += scaled[s] - 1 # the rest of column s is taken from value l
+            (small if scaled[l] < 1 else large).append(l)
+        # the columns left are full (up to rounding errors)
+        self.n = n
+        self.prob = prob.tolist()
+        self.alias = alias.tolist()
+        self.prob_array = prob
+        self.alias_array = alias
+
+    def index(self, rnd):
+        '''
+        Index of the value drawn with the random number 'rnd' (in [0, 1)).
+        '''
+        u = rnd*self.n
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+    def draw(self, rng=random):
+        '''
+        Draw a value with the random generator 'rng'.
+        '''
+        return self.values[self.index(rng.random())]
+
+    def indices(self, rnds):
+        '''
+        Vectorized index() for an array of random numbers.
+        '''
+        u = np.asarray(rnds)*self.n
+        i = u.astype(int)
+        return np.where(u - i < self.prob_array[i], i, self.alias_array[i])
+
+    def sample(self, size, rng=None):
+        '''
+        Draw 'size' values at once with the numpy random generator 'rng'.
+        Outputs:
+            - values (array): Values drawn.
+        '''
+        rng = np.random.default_rng() if rng is None else rng
+        return np.asarray(self.values)[self.indices(rng.random(size))]
+
+
+def table(values, weights):
+    '''
+    AliasTable of a distribution, built once per process for the same values and probabilities.
+    '''
+    return load_table(tuple(values), tuple(float(weight) for weight in weights))
+
+@functools.lru_cache(maxsize=None)
+def load_table(values, weights):
+    return AliasTable(values, weights)
+
+def choice(values, weights, rng=random):
+    '''
+    Draw one of 'values' with the probabilities 'weights', like rng.choices(values, weights)[0].
+    '''
+    return table(values, weights).draw(rng)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+@author: noedi
+
+October 2026
+"""
+
+# Import required modules
+import random
+import zlib
+import numpy as np
+
+
+def new_master_seed():
+    '''
+    Draw a new master seed from the entropy of the operating system.
+    '''
+    return int(np.random.SeedSequence().entropy % 2**32)
+
+
+class HouseholdStreams(object):
+    '''
+    Independent random streams of the components of a single household.
+
+    Each component (e.g. 'members', 'occupancy.0', 'appliance.DishWasher', 'heating', 'ev')
+    draws from its own random.Random generator, derived from the master seed, the index of
+    the household and the name of the component only. A household can thus be simulated
+    alone, in any order or in any process and still give identical results, and adding a
+    component does not change the draws of the others.
+    '''
+
+    def __init__(self, master_seed, index):
+        self.master_seed = master_seed
+        self.index = index
+        self.streams = dict()
+
+    def seed_sequence(self, component):
+        '''
+        Seed sequence of the given component.
+        '''
+        key = zlib.crc32(component.encode('utf-8')) # stable across processes, unlike hash()
+        return np.random.SeedSequence(self.master_seed, spawn_key=(self.index, key))
+
+    def __call__(self, component):
+        '''
+        Random generator of the given component. Calling it again for the same component
+        returns the same generator, which continues its stream.
+        '''
+        if component not in self.streams:
+            state = self.seed_sequence(component).generate_state(4)
+            self.streams[component] = random.Random(int.from_bytes(state.tobytes(), 'little'))
+        return self.streams[component]